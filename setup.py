@@ -0,0 +1,26 @@
+"""Build hook for the optional mypyc-compiled model modules.
+
+Project metadata lives in pyproject.toml. Setting NZR_MYPYC=1 compiles the
+small, fully annotated model modules to C extensions with mypyc; without it
+this is a plain setuptools build.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("NZR_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # audio_file.py (numpy annotations) and result.py (cached_property needs
+    # an instance __dict__) stay pure Python.
+    ext_modules = mypycify(
+        [
+            "src/models/config.py",
+            "src/models/metrics.py",
+            "src/models/stage.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)
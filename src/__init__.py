@@ -1,4 +1,5 @@
 """NZR Music Enhancer - AI-powered music quality enhancement for .wav files."""
 
-__version__ = "0.1.0"
+from ._version import __version__  # noqa: F401
+
 __author__ = "NZR Group"
@@ -0,0 +1,3 @@
+"""Package version, kept free of imports so the CLI can read it cheaply."""
+
+__version__ = "0.1.0"
@@ -1,24 +1,53 @@
 """Command-line interface for the music enhancer."""
 
-import json
-import os
 import sys
+from bisect import bisect_right
+from dataclasses import asdict
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from src import __version__
-from src.models import (
-    AudioFileNotFoundError,
-    EnhancementConfig,
-    EnhancerError,
-    InvalidFormatError,
-    ProcessingResult,
-    QualityLevel,
-)
-from src.services.analyzer import analyze_quality
-from src.services.enhancer import enhance_audio
-from src.services.loader import load_audio, validate_wav_format
+from src._version import __version__
+from src.models import AudioFileNotFoundError, EnhancerError, InvalidFormatError
+
+# Service modules pull in numpy, scipy, librosa and (optionally) DeepFilterNet,
+# so they are imported inside _run() to keep --help and --version fast.
+
+if TYPE_CHECKING:
+    from src.models import EnhancementConfig, ProcessingResult
+
+# orjson is optional - fall back to the standard library encoder
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_APPEND_NEWLINE
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+    def _emit_json(obj: Any) -> None:
+        """Write an object to stdout as indented JSON."""
+        data = orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+        sys.stdout.flush()
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            sys.stdout.write(data.decode())
+            sys.stdout.flush()
+        else:
+            buffer.write(data)
+            buffer.flush()
+
+except ImportError:
+    import json
+
+    def _emit_json(obj: Any) -> None:
+        """Write an object to stdout as indented JSON."""
+        json.dump(obj, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
 
 # Exit codes per CLI contract
 EXIT_SUCCESS = 0
@@ -28,6 +57,23 @@ EXIT_INVALID_FORMAT = 3
 EXIT_PROCESSING_FAILED = 4
 EXIT_WRITE_FAILED = 5
 
+# Auto quality selection: score thresholds and the level for each band
+_AUTO_SCORE_THRESHOLDS = (0.5, 0.7, 0.8)
+_AUTO_QUALITY_LEVELS = ("aggressive", "standard", "light", "minimal")
+
+
+# ANSI color codes, left empty when stdout is not a terminal
+if sys.stdout.isatty():
+    _GREEN, _YELLOW, _CYAN, _BOLD, _RESET = (
+        "\033[32m", "\033[33m", "\033[36m", "\033[1m", "\033[0m"
+    )
+else:
+    _GREEN = _YELLOW = _CYAN = _BOLD = _RESET = ""
+
+_DONE = f"{_GREEN}done{_RESET}"
+_SKIPPED = f"{_YELLOW}skipped{_RESET}"
+_AI_TAG = f"{_CYAN} (AI){_RESET}"
+
 
 @click.command()
 @click.argument("input_file", type=click.Path(exists=False))
@@ -113,9 +159,78 @@ def main(
 
         enhance-audio master.wav -q light --dry-run
     """
+    _run(
+        input_file,
+        output,
+        quality,
+        no_ai,
+        preserve_dynamics,
+        loudness,
+        verbose,
+        quiet,
+        json_output,
+        dry_run,
+    )
+
+
+def run() -> None:
+    """Console entry point.
+
+    Answers ``--version`` and runs the plain ``enhance-audio FILE`` invocation
+    without building Click's command parser; any other argument list is
+    handed to :func:`main`.
+    """
+    args = sys.argv[1:]
+    if args == ["--version"]:
+        print(f"enhance-audio, version {__version__}")
+        return
+    if len(args) == 1 and not args[0].startswith("-"):
+        _fast_main(args[0])
+        return
+    main()
+
+
+def _fast_main(input_file: str) -> None:
+    """Run the pipeline on a single file with all CLI defaults.
+
+    The defaults are read from the Click options themselves, so this path
+    cannot drift from ``enhance-audio FILE`` parsed by :func:`main`.
+    """
+    defaults = {
+        param.name: param.default
+        for param in main.params
+        if param.expose_value and param.name != "input_file"
+    }
+    _run(input_file, **defaults)
+
+
+def _run(
+    input_file: str,
+    output: str | None,
+    quality: str,
+    no_ai: bool,
+    preserve_dynamics: bool,
+    loudness: float,
+    verbose: bool,
+    quiet: bool,
+    json_output: bool,
+    dry_run: bool,
+) -> None:
+    """Analyze and enhance a WAV file, exiting with the contract exit code."""
     # Load environment variables
     _load_env_config()
 
+    # Build config up front so an out-of-range --loudness fails before any work
+    try:
+        config = _build_config(quality, no_ai, preserve_dynamics, loudness)
+    except ValueError as e:
+        message = f"Invalid --loudness {loudness}: {e}"
+        if json_output:
+            _output_error_json(message)
+        else:
+            click.echo(f"Error: {message}", err=True)
+        sys.exit(EXIT_INVALID_ARGS)
+
     try:
         # Validate input file
         input_path = Path(input_file)
@@ -123,19 +238,24 @@ def main(
         if not input_path.exists():
             raise AudioFileNotFoundError(str(input_path))
 
-        validate_wav_format(input_path)
+        from src.services import load_audio, validate_wav_format
+
+        # Existence is checked once above, not again by the loader
+        validate_wav_format(input_path, check_exists=False)
 
         # Load audio
         if not quiet and not json_output:
             click.echo(f"Analyzing: {input_path.name}")
 
-        audio_file = load_audio(input_path)
+        audio_file = load_audio(input_path, check_exists=False)
 
         # Display input info
         if not quiet and not json_output:
             _display_audio_info(audio_file)
 
         # Analyze quality
+        from src.services import analyze_quality
+
         metrics = analyze_quality(audio_file)
 
         if not quiet and not json_output:
@@ -149,15 +269,20 @@ def main(
                 _display_dry_run_info(metrics, quality, no_ai)
             return
 
-        # Build config
-        config = _build_config(quality, no_ai, preserve_dynamics, loudness)
-
         # Process audio
         if not quiet and not json_output:
             click.echo()
             click.echo("Processing...")
 
-        result = enhance_audio(audio_file, config, output)
+        from src.services import enhance_audio
+
+        # Output metrics are only shown in normal and JSON output
+        result = enhance_audio(
+            audio_file,
+            config,
+            output,
+            validate_output=json_output or not quiet,
+        )
 
         if not result.success:
             if json_output:
@@ -208,14 +333,14 @@ def _load_env_config() -> None:
 
 def _display_audio_info(audio_file) -> None:
     """Display audio file information."""
-    duration_min = int(audio_file.duration // 60)
-    duration_sec = int(audio_file.duration % 60)
+    sr, bd, dur = audio_file.sample_rate, audio_file.bit_depth, audio_file.duration
+    duration_min = int(dur // 60)
+    duration_sec = int(dur % 60)
 
     channel_str = "mono" if audio_file.is_mono else "stereo"
 
-    click.echo(f"  Format: WAV, {audio_file.sample_rate} Hz, "
-               f"{audio_file.bit_depth}-bit, {channel_str}")
-    click.echo(f"  Duration: {duration_min}:{duration_sec:02d}")
+    click.echo(f"  Format: WAV, {sr} Hz, {bd}-bit, {channel_str}\n"
+               f"  Duration: {duration_min}:{duration_sec:02d}")
 
 
 def _display_quality_info(metrics) -> None:
@@ -223,39 +348,43 @@ def _display_quality_info(metrics) -> None:
     click.echo(f"  Quality: {metrics.quality_level} (score: {metrics.quality_score:.2f})")
 
 
+def _effective_quality(metrics, user_quality: str) -> str:
+    """Resolve the quality level that processing would use.
+
+    Mirrors the auto selection in ``select_config``: score thresholds pick
+    the level, and a medium score with low SNR is escalated to aggressive.
+    """
+    if user_quality != "auto":
+        return user_quality
+
+    level = bisect_right(_AUTO_SCORE_THRESHOLDS, metrics.quality_score)
+    if level == 1 and metrics.snr_db < 20:
+        level = 0
+    return _AUTO_QUALITY_LEVELS[level]
+
+
 def _display_dry_run_info(metrics, quality: str, no_ai: bool) -> None:
     """Display dry run analysis information."""
-    click.echo()
-    click.echo("Recommended processing:")
-
-    # Determine effective quality level
-    if quality == "auto":
-        if metrics.is_excellent_quality:
-            effective_quality = "minimal"
-        elif metrics.is_high_quality:
-            effective_quality = "light"
-        elif metrics.needs_ai_enhancement:
-            effective_quality = "aggressive"
-        else:
-            effective_quality = "standard"
-    else:
-        effective_quality = quality
+    lines = ["", "Recommended processing:"]
+
+    effective_quality = _effective_quality(metrics, quality)
 
-    click.echo(f"  Level: {effective_quality}")
+    lines.append(f"  Level: {effective_quality}")
 
     # Stages depend on quality level
     if effective_quality == "minimal":
         stages = ["noise_reduction"]
     else:
         stages = ["noise_reduction", "spectral_enhancement", "dynamic_optimization"]
-    click.echo(f"  Stages: {', '.join(stages)}")
+    lines.append(f"  Stages: {', '.join(stages)}")
 
     ai_recommended = metrics.needs_ai_enhancement and not no_ai
     ai_str = "recommended" if ai_recommended else "not needed" if not no_ai else "disabled"
-    click.echo(f"  AI enhancement: {ai_str}")
+    lines.append(f"  AI enhancement: {ai_str}")
 
-    click.echo()
-    click.echo(click.style("No changes made (dry run).", fg="yellow"))
+    lines.append("")
+    lines.append(f"{_YELLOW}No changes made (dry run).{_RESET}")
+    click.echo("\n".join(lines))
 
 
 def _output_dry_run_json(audio_file, metrics, quality: str, no_ai: bool) -> None:
@@ -263,14 +392,7 @@ def _output_dry_run_json(audio_file, metrics, quality: str, no_ai: bool) -> None
     result = {
         "success": True,
         "dry_run": True,
-        "input": {
-            "path": str(audio_file.path),
-            "format": audio_file.format,
-            "sample_rate": audio_file.sample_rate,
-            "bit_depth": audio_file.bit_depth,
-            "channels": audio_file.channels,
-            "duration_seconds": audio_file.duration,
-        },
+        "input": _audio_file_json(audio_file),
         "metrics": {
             "quality_score": metrics.quality_score,
             "quality_level": metrics.quality_level,
@@ -278,16 +400,11 @@ def _output_dry_run_json(audio_file, metrics, quality: str, no_ai: bool) -> None
             "needs_ai_enhancement": metrics.needs_ai_enhancement,
         },
         "recommended": {
-            "quality_level": quality if quality != "auto" else (
-                "minimal" if metrics.is_excellent_quality else
-                "light" if metrics.is_high_quality else
-                "aggressive" if metrics.needs_ai_enhancement else
-                "standard"
-            ),
+            "quality_level": _effective_quality(metrics, quality),
             "ai_enhancement": metrics.needs_ai_enhancement and not no_ai,
         },
     }
-    click.echo(json.dumps(result, indent=2))
+    _emit_json(result)
 
 
 def _build_config(
@@ -295,97 +412,94 @@ def _build_config(
     no_ai: bool,
     preserve_dynamics: bool,
     loudness: float,
-) -> EnhancementConfig:
-    """Build enhancement config from CLI options."""
-    quality_level = QualityLevel(quality)
-
-    if quality == "minimal":
-        config = EnhancementConfig.minimal()
-    elif quality == "light":
-        config = EnhancementConfig.light()
-    elif quality == "standard":
-        config = EnhancementConfig.standard()
-    elif quality == "aggressive":
-        config = EnhancementConfig.aggressive()
-    else:  # auto
-        config = EnhancementConfig()
-        config.quality_level = QualityLevel.AUTO
-
-    # Apply user overrides
-    config.ai_enhancement_enabled = not no_ai
-    config.preserve_dynamics = preserve_dynamics
-    config.target_loudness_lufs = loudness
-
-    return config
+) -> "EnhancementConfig":
+    """Build enhancement config from CLI options.
+
+    Raises:
+        ValueError: If ``loudness`` is outside the allowed range.
+    """
+    from src.models import EnhancementConfig, QualityLevel
+
+    config = EnhancementConfig.preset(QualityLevel(quality))
+
+    # The default invocation matches the preset exactly - reuse it as is
+    if (
+        config.ai_enhancement_enabled == (not no_ai)
+        and config.preserve_dynamics == preserve_dynamics
+        and config.target_loudness_lufs == loudness
+    ):
+        return config
+
+    # Apply user overrides; validated() range-checks the loudness
+    return EnhancementConfig.validated(**{
+        **asdict(config),
+        "ai_enhancement_enabled": not no_ai,
+        "preserve_dynamics": preserve_dynamics,
+        "target_loudness_lufs": loudness,
+    })
 
 
 def _display_results(result, verbose: bool) -> None:
     """Display processing results."""
-    click.echo()
+    lines = [""]
 
     # Stage summary
     for stage in result.processing_stages:
+        name = stage.name
         if stage.enabled:
-            status = click.style("done", fg="green")
+            status = _DONE
             # Show AI indicator for noise reduction
-            if stage.name == "noise_reduction" and stage.parameters.get("ai_used"):
-                status += click.style(" (AI)", fg="cyan")
+            if stage.ai_used:
+                status += _AI_TAG
             if verbose:
                 status += f" ({stage.duration_seconds:.2f}s)"
         else:
-            status = click.style("skipped", fg="yellow")
+            status = _SKIPPED
 
-        click.echo(f"  {stage.name}: {status}")
+        lines.append(f"  {name}: {status}")
 
-    click.echo()
-    click.echo(click.style(f"Complete: {result.output_file.path.name}", fg="green", bold=True))
+    lines.append("")
+    lines.append(f"{_GREEN}{_BOLD}Complete: {result.output_file.path.name}{_RESET}")
 
     # Quality improvement stats
-    if result.input_metrics and result.output_metrics:
+    im, om = result.input_metrics, result.output_metrics
+    if im and om:
         improvement = result.quality_improvement_percent
-        input_score = result.input_metrics.quality_score
-        output_score = result.output_metrics.quality_score
 
-        click.echo(f"  Quality improved: {input_score:.2f} → {output_score:.2f} "
-                   f"({improvement:+.0f}%)")
+        lines.append(f"  Quality improved: {im.quality_score:.2f} → {om.quality_score:.2f} "
+                     f"({improvement:+.0f}%)")
 
         snr_improvement = result.snr_improvement_db
-        click.echo(f"  SNR: {result.input_metrics.snr_db:.0f} dB → "
-                   f"{result.output_metrics.snr_db:.0f} dB "
-                   f"({snr_improvement:+.0f} dB)")
+        lines.append(f"  SNR: {im.snr_db:.0f} dB → {om.snr_db:.0f} dB "
+                     f"({snr_improvement:+.0f} dB)")
 
     # Processing time
-    duration_min = int(result.duration_seconds // 60)
-    duration_sec = result.duration_seconds % 60
+    total_seconds = result.duration_seconds
+    duration_min = int(total_seconds // 60)
+    duration_sec = total_seconds % 60
     if duration_min > 0:
-        click.echo(f"  Processing time: {duration_min}m {duration_sec:.0f}s")
+        lines.append(f"  Processing time: {duration_min}m {duration_sec:.0f}s")
     else:
-        click.echo(f"  Processing time: {duration_sec:.1f}s")
+        lines.append(f"  Processing time: {duration_sec:.1f}s")
+
+    click.echo("\n".join(lines))
 
 
-def _output_result_json(result: ProcessingResult) -> None:
+def _output_result_json(result: "ProcessingResult") -> None:
     """Output processing result as JSON."""
+    out = result.output_file
+    if out is None:
+        _output_error_json(result.error_message or "Processing failed")
+        return
+
+    im, om = result.input_metrics, result.output_metrics
     output = {
         "success": result.success,
-        "input": {
-            "path": str(result.input_file.path),
-            "format": result.input_file.format,
-            "sample_rate": result.input_file.sample_rate,
-            "bit_depth": result.input_file.bit_depth,
-            "channels": result.input_file.channels,
-            "duration_seconds": result.input_file.duration,
-        },
-        "output": {
-            "path": str(result.output_file.path) if result.output_file else None,
-            "format": result.output_file.format if result.output_file else None,
-            "sample_rate": result.output_file.sample_rate if result.output_file else None,
-            "bit_depth": result.output_file.bit_depth if result.output_file else None,
-            "channels": result.output_file.channels if result.output_file else None,
-            "duration_seconds": result.output_file.duration if result.output_file else None,
-        },
+        "input": _audio_file_json(result.input_file),
+        "output": _audio_file_json(out),
         "metrics": {
-            "input_quality_score": result.input_metrics.quality_score if result.input_metrics else None,
-            "output_quality_score": result.output_metrics.quality_score if result.output_metrics else None,
+            "input_quality_score": im.quality_score if im else None,
+            "output_quality_score": om.quality_score if om else None,
             "snr_improvement_db": result.snr_improvement_db,
         },
         "processing": {
@@ -394,7 +508,19 @@ def _output_result_json(result: ProcessingResult) -> None:
             "duration_seconds": result.duration_seconds,
         },
     }
-    click.echo(json.dumps(output, indent=2))
+    _emit_json(output)
+
+
+def _audio_file_json(audio_file) -> dict:
+    """Build the JSON representation of an audio file's metadata."""
+    return {
+        "path": audio_file.path,
+        "format": audio_file.format,
+        "sample_rate": audio_file.sample_rate,
+        "bit_depth": audio_file.bit_depth,
+        "channels": audio_file.channels,
+        "duration_seconds": audio_file.duration,
+    }
 
 
 def _output_error_json(message: str) -> None:
@@ -403,8 +529,8 @@ def _output_error_json(message: str) -> None:
         "success": False,
         "error": message,
     }
-    click.echo(json.dumps(output, indent=2))
+    _emit_json(output)
 
 
 if __name__ == "__main__":
-    main()
+    run()
@@ -1,7 +1,8 @@
 """Data models for the music enhancer."""
 
-from .audio_file import AudioFile
-from .config import EnhancementConfig, QualityLevel
+import importlib
+from typing import Any
+
 from .errors import (
     AudioFileNotFoundError,
     EnhancerError,
@@ -13,9 +14,17 @@ from .errors import (
     ProcessingFailedError,
     UnsupportedChannelsError,
 )
-from .metrics import QualityMetrics
-from .result import ProcessingResult
-from .stage import ProcessingStage
+
+# Data classes are imported on first access (PEP 562) so that importing the
+# error types does not drag in numpy through audio_file.py.
+_LAZY = {
+    "AudioFile": ("audio_file", "AudioFile"),
+    "EnhancementConfig": ("config", "EnhancementConfig"),
+    "ProcessingResult": ("result", "ProcessingResult"),
+    "ProcessingStage": ("stage", "ProcessingStage"),
+    "QualityLevel": ("config", "QualityLevel"),
+    "QualityMetrics": ("metrics", "QualityMetrics"),
+}
 
 __all__ = [
     # Data classes
@@ -36,3 +45,13 @@ __all__ = [
     "ProcessingFailedError",
     "UnsupportedChannelsError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
@@ -2,9 +2,10 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass
@@ -27,7 +28,7 @@ class AudioFile:
     bit_depth: int
     channels: int
     duration: float
-    samples: np.ndarray = field(repr=False)
+    samples: "np.ndarray" = field(repr=False)
 
     @property
     def is_mono(self) -> bool:
@@ -48,7 +49,7 @@ class AudioFile:
     def from_file(
         cls,
         path: Path,
-        samples: np.ndarray,
+        samples: "np.ndarray",
         sample_rate: int,
         bit_depth: int = 16,
     ) -> "AudioFile":
@@ -63,16 +64,18 @@ class AudioFile:
         Returns:
             AudioFile instance.
         """
+        path = path if isinstance(path, Path) else Path(path)
+
         if samples.ndim == 1:
             channels = 1
         else:
             channels = samples.shape[1]
 
-        duration = len(samples) / sample_rate
+        duration = samples.shape[0] / sample_rate
 
         return cls(
-            path=Path(path),
-            format=Path(path).suffix.lstrip(".").lower(),
+            path=path,
+            format=path.suffix[1:].lower(),
             sample_rate=sample_rate,
             bit_depth=bit_depth,
             channels=channels,
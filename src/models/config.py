@@ -1,8 +1,8 @@
 """EnhancementConfig data class for enhancement pipeline configuration."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Any
 
 
 class QualityLevel(Enum):
@@ -15,10 +15,13 @@ class QualityLevel(Enum):
     AGGRESSIVE = "aggressive"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EnhancementConfig:
     """Configuration parameters for the enhancement pipeline.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive a
+    modified configuration.
+
     Attributes:
         noise_reduction_strength: Intensity of noise reduction (0.0 to 1.0).
         eq_enabled: Whether to apply equalization.
@@ -37,61 +40,92 @@ class EnhancementConfig:
     target_loudness_lufs: float = -14.0
     quality_level: QualityLevel = QualityLevel.AUTO
 
-    def __post_init__(self):
-        """Validate configuration values."""
-        if not 0.0 <= self.noise_reduction_strength <= 1.0:
+    @classmethod
+    def validated(cls, **kwargs: Any) -> "EnhancementConfig":
+        """Create a configuration from untrusted values, checking their ranges.
+
+        The plain constructor does not validate, so the built-in presets and
+        internal derivations skip the checks.
+
+        Args:
+            **kwargs: Field values for the configuration.
+
+        Returns:
+            EnhancementConfig instance.
+
+        Raises:
+            ValueError: If a value is outside its allowed range.
+        """
+        config = cls(**kwargs)
+        if not 0.0 <= config.noise_reduction_strength <= 1.0:
             raise ValueError("noise_reduction_strength must be between 0.0 and 1.0")
-        if not -60.0 <= self.target_loudness_lufs <= 0.0:
+        if not -60.0 <= config.target_loudness_lufs <= 0.0:
             raise ValueError("target_loudness_lufs must be between -60.0 and 0.0")
+        return config
+
+    @classmethod
+    def preset(cls, level: QualityLevel) -> "EnhancementConfig":
+        """Get the shared preset configuration for a quality level."""
+        return _PRESETS[level]
 
     @classmethod
     def minimal(cls) -> "EnhancementConfig":
-        """Create a minimal processing configuration for excellent quality inputs.
+        """Get the minimal processing configuration for excellent quality inputs.
 
         This configuration preserves the original quality by only applying
         very subtle noise reduction without EQ or dynamics changes.
         """
-        return cls(
-            noise_reduction_strength=0.1,
-            eq_enabled=False,
-            dynamics_enabled=False,
-            ai_enhancement_enabled=False,
-            preserve_dynamics=True,
-            quality_level=QualityLevel.MINIMAL,
-        )
+        return _PRESETS[QualityLevel.MINIMAL]
 
     @classmethod
     def light(cls) -> "EnhancementConfig":
-        """Create a light processing configuration for high-quality inputs."""
-        return cls(
-            noise_reduction_strength=0.2,
-            eq_enabled=True,
-            dynamics_enabled=True,
-            ai_enhancement_enabled=False,
-            preserve_dynamics=True,
-            quality_level=QualityLevel.LIGHT,
-        )
+        """Get the light processing configuration for high-quality inputs."""
+        return _PRESETS[QualityLevel.LIGHT]
 
     @classmethod
     def standard(cls) -> "EnhancementConfig":
-        """Create a standard processing configuration for average quality inputs."""
-        return cls(
-            noise_reduction_strength=0.5,
-            eq_enabled=True,
-            dynamics_enabled=True,
-            ai_enhancement_enabled=True,
-            preserve_dynamics=True,
-            quality_level=QualityLevel.STANDARD,
-        )
+        """Get the standard processing configuration for average quality inputs."""
+        return _PRESETS[QualityLevel.STANDARD]
 
     @classmethod
     def aggressive(cls) -> "EnhancementConfig":
-        """Create an aggressive processing configuration for poor quality inputs."""
-        return cls(
-            noise_reduction_strength=0.8,
-            eq_enabled=True,
-            dynamics_enabled=True,
-            ai_enhancement_enabled=True,
-            preserve_dynamics=False,
-            quality_level=QualityLevel.AGGRESSIVE,
-        )
+        """Get the aggressive processing configuration for poor quality inputs."""
+        return _PRESETS[QualityLevel.AGGRESSIVE]
+
+
+# Preset configurations are built once; they are frozen, so sharing is safe.
+_PRESETS: dict[QualityLevel, EnhancementConfig] = {
+    QualityLevel.AUTO: EnhancementConfig(),
+    QualityLevel.MINIMAL: EnhancementConfig(
+        noise_reduction_strength=0.1,
+        eq_enabled=False,
+        dynamics_enabled=False,
+        ai_enhancement_enabled=False,
+        preserve_dynamics=True,
+        quality_level=QualityLevel.MINIMAL,
+    ),
+    QualityLevel.LIGHT: EnhancementConfig(
+        noise_reduction_strength=0.2,
+        eq_enabled=True,
+        dynamics_enabled=True,
+        ai_enhancement_enabled=False,
+        preserve_dynamics=True,
+        quality_level=QualityLevel.LIGHT,
+    ),
+    QualityLevel.STANDARD: EnhancementConfig(
+        noise_reduction_strength=0.5,
+        eq_enabled=True,
+        dynamics_enabled=True,
+        ai_enhancement_enabled=True,
+        preserve_dynamics=True,
+        quality_level=QualityLevel.STANDARD,
+    ),
+    QualityLevel.AGGRESSIVE: EnhancementConfig(
+        noise_reduction_strength=0.8,
+        eq_enabled=True,
+        dynamics_enabled=True,
+        ai_enhancement_enabled=True,
+        preserve_dynamics=False,
+        quality_level=QualityLevel.AGGRESSIVE,
+    ),
+}
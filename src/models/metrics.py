@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualityMetrics:
     """Assessment of audio quality used to determine processing intensity.
 
@@ -1,6 +1,7 @@
 """ProcessingResult data class for enhancement outcomes."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
 from .audio_file import AudioFile
@@ -56,14 +57,14 @@ class ProcessingResult:
         improvement = self.output_metrics.quality_score - self.input_metrics.quality_score
         return (improvement / self.input_metrics.quality_score) * 100
 
-    @property
+    @cached_property
     def ai_was_used(self) -> bool:
-        """Check if AI enhancement was used in any stage."""
-        ai_methods = {"deepfilternet", "ai", "neural"}
-        for stage in self.processing_stages:
-            if stage.enabled and any(m in stage.method.lower() for m in ai_methods):
-                return True
-        return False
+        """Check if AI enhancement was used in any stage.
+
+        Computed once on first access; stages are expected to be complete
+        by the time the result is inspected.
+        """
+        return any(stage.enabled and stage.ai_used for stage in self.processing_stages)
 
     @classmethod
     def failure(cls, input_file: AudioFile, error_message: str) -> "ProcessingResult":
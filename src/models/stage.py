@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessingStage:
     """Individual step in the enhancement pipeline.
 
@@ -14,6 +14,7 @@ class ProcessingStage:
         method: Technique used (e.g., "deepfilternet", "spectral_gating").
         parameters: Parameters applied during this stage.
         duration_seconds: Time taken for this stage.
+        ai_used: Whether an AI model did the processing in this stage.
     """
 
     name: str
@@ -21,6 +22,7 @@ class ProcessingStage:
     method: str = ""
     parameters: dict[str, Any] = field(default_factory=dict)
     duration_seconds: float = 0.0
+    ai_used: bool = False
 
     @classmethod
     def skipped(cls, name: str) -> "ProcessingStage":
@@ -34,6 +36,7 @@ class ProcessingStage:
         method: str,
         duration: float,
         parameters: dict[str, Any] | None = None,
+        ai_used: bool = False,
     ) -> "ProcessingStage":
         """Create a completed stage record.
 
@@ -42,6 +45,7 @@ class ProcessingStage:
             method: Method used.
             duration: Time taken in seconds.
             parameters: Parameters used.
+            ai_used: Whether an AI model was used.
 
         Returns:
             ProcessingStage instance.
@@ -52,4 +56,5 @@ class ProcessingStage:
             method=method,
             parameters=parameters or {},
             duration_seconds=duration,
+            ai_used=ai_used,
         )
@@ -1,12 +1,26 @@
 """Services for audio processing."""
 
-from .analyzer import analyze_quality
-from .dynamics import compress_dynamics, normalize_loudness
-from .enhancer import enhance_audio, select_config
-from .exporter import generate_output_path, save_audio
-from .loader import load_audio, validate_wav_format
-from .noise_reduction import reduce_noise_spectral
-from .spectral import apply_eq, enhance_clarity
+import importlib
+from typing import Any
+
+# Service functions are imported on first access (PEP 562). Importing one
+# service module must not pull in the rest of the pipeline (noisereduce,
+# DeepFilterNet, ...) through this package.
+_LAZY = {
+    "analyze_quality": ("analyzer", "analyze_quality"),
+    "compress_dynamics": ("dynamics", "compress_dynamics"),
+    "normalize_loudness": ("dynamics", "normalize_loudness"),
+    "enhance_audio": ("enhancer", "enhance_audio"),
+    "enhance_audio_batch": ("enhancer", "enhance_audio_batch"),
+    "select_config": ("enhancer", "select_config"),
+    "generate_output_path": ("exporter", "generate_output_path"),
+    "save_audio": ("exporter", "save_audio"),
+    "load_audio": ("loader", "load_audio"),
+    "validate_wav_format": ("loader", "validate_wav_format"),
+    "reduce_noise_spectral": ("noise_reduction", "reduce_noise_spectral"),
+    "apply_eq": ("spectral", "apply_eq"),
+    "enhance_clarity": ("spectral", "enhance_clarity"),
+}
 
 __all__ = [
     # Loader
@@ -27,5 +41,16 @@ __all__ = [
     "normalize_loudness",
     # Enhancer
     "enhance_audio",
+    "enhance_audio_batch",
     "select_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
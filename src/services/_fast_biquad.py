@@ -0,0 +1,111 @@
+"""Compiled zero-phase biquad cascade for the EQ stage."""
+
+import numpy as np
+from numba import njit, prange
+from scipy import signal
+
+
+def cascade_filtfilt(samples: np.ndarray, sos: np.ndarray) -> np.ndarray:
+    """Zero-phase filter samples through a cascade of biquad sections.
+
+    Equivalent to ``scipy.signal.sosfiltfilt(sos, samples, axis=0)`` with
+    its default odd padding, but each channel streams through the whole
+    cascade once forward and once backward in compiled code, so the signal
+    is traversed twice instead of twice per section.
+
+    Args:
+        samples: Audio samples (mono or stereo), time on axis 0.
+        sos: Second-order sections of shape (n_sections, 6).
+
+    Returns:
+        Filtered samples with the same shape and dtype as ``samples``.
+
+    Raises:
+        ValueError: If the signal is not longer than the edge padding.
+    """
+    sos = np.ascontiguousarray(sos, dtype=np.float64)
+
+    padlen = filtfilt_padlen(sos)
+    if samples.shape[0] <= padlen:
+        raise ValueError(
+            f"The length of the input vector must be greater than padlen, "
+            f"which is {padlen}."
+        )
+
+    zi = signal.sosfilt_zi(sos)
+
+    channels = samples.reshape(samples.shape[0], -1)
+    filtered = np.empty_like(channels)
+    _filtfilt_channels(channels, sos, zi, padlen, filtered)
+    return filtered.reshape(samples.shape)
+
+
+def filtfilt_padlen(sos: np.ndarray) -> int:
+    """Edge padding length sosfiltfilt uses by default for a cascade.
+
+    Signals must be longer than this to be filtered.
+    """
+    n_taps = 2 * sos.shape[0] + 1
+    n_taps -= min(int((sos[:, 2] == 0).sum()), int((sos[:, 5] == 0).sum()))
+    return 3 * n_taps
+
+
+@njit(cache=True, parallel=True)
+def _filtfilt_channels(
+    channels: np.ndarray,
+    sos: np.ndarray,
+    zi: np.ndarray,
+    padlen: int,
+    out: np.ndarray,
+) -> None:
+    """Run _filtfilt_channel over every column, one channel per thread."""
+    for ch in prange(channels.shape[1]):
+        _filtfilt_channel(channels[:, ch], sos, zi, padlen, out[:, ch])
+
+
+@njit(cache=True, fastmath=True)
+def _filtfilt_channel(
+    x: np.ndarray,
+    sos: np.ndarray,
+    zi: np.ndarray,
+    padlen: int,
+    out: np.ndarray,
+) -> None:
+    """Forward-backward cascade filter of one channel into ``out`` (compiled)."""
+    n = x.shape[0]
+    n_ext = n + 2 * padlen
+    n_sections = sos.shape[0]
+
+    # Odd extension at both ends, as scipy.signal's odd_ext
+    ext = np.empty(n_ext)
+    for i in range(padlen):
+        ext[i] = 2.0 * x[0] - x[padlen - i]
+    for i in range(n):
+        ext[padlen + i] = x[i]
+    for i in range(padlen):
+        ext[padlen + n + i] = 2.0 * x[n - 1] - x[n - 2 - i]
+
+    # Forward pass, state primed with the first sample
+    state = zi * ext[0]
+    for i in range(n_ext):
+        value = ext[i]
+        for s in range(n_sections):
+            y = sos[s, 0] * value + state[s, 0]
+            state[s, 0] = sos[s, 1] * value - sos[s, 4] * y + state[s, 1]
+            state[s, 1] = sos[s, 2] * value - sos[s, 5] * y
+            value = y
+        ext[i] = value
+
+    # Backward pass over the forward output, primed with its last sample
+    state = zi * ext[n_ext - 1]
+    for i in range(n_ext - 1, -1, -1):
+        value = ext[i]
+        for s in range(n_sections):
+            y = sos[s, 0] * value + state[s, 0]
+            state[s, 0] = sos[s, 1] * value - sos[s, 4] * y + state[s, 1]
+            state[s, 1] = sos[s, 2] * value - sos[s, 5] * y
+            value = y
+        ext[i] = value
+
+    for i in range(n):
+        out[i] = ext[padlen + i]
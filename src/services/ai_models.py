@@ -1,17 +1,13 @@
 """AI model management service for DeepFilterNet."""
 
 import os
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Optional
 
-# DeepFilterNet imports are optional - gracefully handle if not installed
-try:
-    from df.enhance import enhance, init_df
-    DEEPFILTERNET_AVAILABLE = True
-except ImportError:
-    DEEPFILTERNET_AVAILABLE = False
-    init_df = None
-    enhance = None
+# DeepFilterNet is optional. Only probe for it here: importing it pulls in
+# torch, so the actual import is deferred until a model is loaded.
+DEEPFILTERNET_AVAILABLE = find_spec("df") is not None
 
 
 # Global model cache
@@ -39,18 +35,16 @@ def get_model_path() -> Path:
 def is_model_available() -> bool:
     """Check if DeepFilterNet model is available.
 
+    This is a cheap check: it does not load the model. DeepFilterNet
+    fetches its weights on first use, so a failed load is reported later
+    by load_deepfilternet() and callers fall back to spectral gating.
+
     Returns:
-        True if DeepFilterNet is installed and model can be loaded.
+        True if DeepFilterNet is installed or the model is already loaded.
     """
-    if not DEEPFILTERNET_AVAILABLE:
-        return False
-
-    try:
-        # Try to initialize to verify model availability
-        load_deepfilternet()
+    if "deepfilternet" in _model_cache:
         return True
-    except Exception:
-        return False
+    return DEEPFILTERNET_AVAILABLE
 
 
 def load_deepfilternet() -> tuple[Any, Any, Any]:
@@ -72,6 +66,8 @@ def load_deepfilternet() -> tuple[Any, Any, Any]:
         return _model_cache["deepfilternet"]
 
     try:
+        from df.enhance import init_df
+
         # Initialize DeepFilterNet with default model
         model, df_state, sr = init_df()
         _model_cache["deepfilternet"] = (model, df_state, sr)
@@ -80,6 +76,26 @@ def load_deepfilternet() -> tuple[Any, Any, Any]:
         raise RuntimeError(f"Failed to load DeepFilterNet model: {e}")
 
 
+def preload_deepfilternet() -> bool:
+    """Load DeepFilterNet into the process-wide cache ahead of time.
+
+    Used as the worker initializer of enhance_audio_batch(): each spawned
+    worker loads its own copy once at startup and reuses it for every file
+    it processes, instead of paying the load on its first AI file.
+
+    Returns:
+        True if the model is loaded and cached.
+    """
+    if not DEEPFILTERNET_AVAILABLE:
+        return False
+
+    try:
+        load_deepfilternet()
+        return True
+    except RuntimeError:
+        return False
+
+
 def unload_models() -> None:
     """Unload all cached models to free memory."""
     global _model_cache
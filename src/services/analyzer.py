@@ -1,10 +1,30 @@
 """Audio quality analysis service."""
 
+import math
+from functools import lru_cache
+
 import numpy as np
-import librosa
+from numba import njit, prange
+from scipy import fft, signal
 
 from src.models import AudioFile, QualityMetrics
 
+# Default thresholds shared by the single-pass level scan
+_CLIP_THRESHOLD = 0.99
+_SILENCE_THRESHOLD_DB = -60
+
+# STFT settings for spectral flatness
+_FLATNESS_N_FFT = 2048
+_FLATNESS_HOP_LENGTH = 512
+_FLATNESS_BLOCK_FRAMES = 256
+
+# Quality score weights
+_SNR_WEIGHT = 0.35
+_FLATNESS_WEIGHT = 0.20
+_DYNAMIC_RANGE_WEIGHT = 0.20
+_CLIPPING_WEIGHT = 0.20
+_SILENCE_WEIGHT = 0.05
+
 
 def analyze_quality(audio_file: AudioFile) -> QualityMetrics:
     """Analyze audio quality and return metrics.
@@ -18,8 +38,16 @@ def analyze_quality(audio_file: AudioFile) -> QualityMetrics:
     samples = audio_file.samples
     sr = audio_file.sample_rate
 
+    # float32 is ample for analysis and halves the memory traffic per pass
+    if samples.dtype != np.float32:
+        samples = samples.astype(np.float32, copy=False)
+
     # Ensure mono for analysis (average channels if stereo)
-    if samples.ndim > 1:
+    if samples.ndim > 1 and samples.shape[1] == 2:
+        # Single add-then-scale pass for the common stereo case
+        samples_mono = np.add(samples[:, 0], samples[:, 1])
+        samples_mono *= 0.5
+    elif samples.ndim > 1:
         samples_mono = np.mean(samples, axis=1)
     else:
         samples_mono = samples
@@ -27,9 +55,7 @@ def analyze_quality(audio_file: AudioFile) -> QualityMetrics:
     # Calculate individual metrics
     snr_db = estimate_snr(samples_mono, sr)
     spectral_flatness = calculate_spectral_flatness(samples_mono, sr)
-    dynamic_range_db = calculate_dynamic_range(samples_mono)
-    clipping_ratio = calculate_clipping_ratio(samples_mono)
-    silence_ratio = calculate_silence_ratio(samples_mono)
+    dynamic_range_db, clipping_ratio, silence_ratio = _level_metrics(samples_mono)
 
     # Calculate overall quality score (0.0 to 1.0)
     quality_score = _calculate_quality_score(
@@ -63,40 +89,49 @@ def estimate_snr(samples: np.ndarray, sr: int) -> float:
     Returns:
         Estimated SNR in decibels.
     """
-    # Frame the audio into chunks
+    # Frame the audio into 50ms chunks
     frame_length = int(sr * 0.05)  # 50ms frames
     hop_length = frame_length // 2
 
-    # Calculate RMS for each frame
-    frames = librosa.util.frame(samples, frame_length=frame_length, hop_length=hop_length)
-    rms_per_frame = np.sqrt(np.mean(frames**2, axis=0))
+    if hop_length <= 0 or len(samples) < frame_length:
+        return 0.0
+    n_frames = 1 + (len(samples) - frame_length) // hop_length
+
+    # Calculate RMS for each frame from a running sum of squares, without
+    # materializing the (frame_length x n_frames) frame matrix
+    cumsum_sq = np.empty(len(samples) + 1, dtype=np.float64)
+    cumsum_sq[0] = 0.0
+    np.cumsum(np.square(samples, dtype=np.float64), out=cumsum_sq[1:])
+
+    starts = np.arange(n_frames) * hop_length
+    frame_sums = cumsum_sq[starts + frame_length] - cumsum_sq[starts]
+    # Cancellation in the running sum can leave tiny negative values
+    np.maximum(frame_sums, 0.0, out=frame_sums)
+    rms_per_frame = np.sqrt(frame_sums / frame_length)
 
     # Avoid log of zero
     rms_per_frame = np.maximum(rms_per_frame, 1e-10)
 
-    # Signal: top 10% loudest frames
-    # Noise: bottom 10% quietest non-silent frames
-    sorted_rms = np.sort(rms_per_frame)
-
     # Find non-silent frames (above -60 dB threshold)
-    non_silent_mask = rms_per_frame > 1e-3
-    if np.sum(non_silent_mask) < 10:
+    non_silent_rms = rms_per_frame[rms_per_frame > 1e-3]
+    if len(non_silent_rms) < 10:
         # Very quiet or silent audio
         return 0.0
 
-    non_silent_rms = sorted_rms[sorted_rms > 1e-3]
-
+    # Signal: top 10% loudest frames
+    # Noise: bottom 10% quietest non-silent frames
+    # Only the two tails are needed, so partition instead of a full sort
     n_frames = len(non_silent_rms)
-    top_10_percent = max(1, n_frames // 10)
-    bottom_10_percent = max(1, n_frames // 10)
+    tail = max(1, n_frames // 10)
+    parted = np.partition(non_silent_rms, (tail, n_frames - tail))
 
-    signal_rms = np.mean(non_silent_rms[-top_10_percent:])
-    noise_rms = np.mean(non_silent_rms[:bottom_10_percent])
+    signal_rms = np.mean(parted[n_frames - tail :])
+    noise_rms = np.mean(parted[:tail])
 
     if noise_rms < 1e-10:
         return 60.0  # Very clean signal
 
-    snr = 20 * np.log10(signal_rms / noise_rms)
+    snr = 20 * math.log10(signal_rms / noise_rms)
     return float(np.clip(snr, 0, 60))
 
 
@@ -110,11 +145,39 @@ def calculate_spectral_flatness(samples: np.ndarray, sr: int) -> float:
     Returns:
         Average spectral flatness (0.0 to 1.0).
     """
-    # Calculate spectral flatness using librosa
-    flatness = librosa.feature.spectral_flatness(y=samples, n_fft=2048, hop_length=512)
+    n_fft = _FLATNESS_N_FFT
+    hop_length = _FLATNESS_HOP_LENGTH
+
+    # Centered frames with zero padding, as librosa.stft does by default
+    padded = np.pad(samples, n_fft // 2)
+    frames = np.lib.stride_tricks.sliding_window_view(padded, n_fft)[::hop_length]
+    if frames.shape[0] == 0:
+        return 0.0
+
+    window = _hann_window(n_fft)
+    flatness_sum = 0.0
+
+    # Transform in blocks of frames to bound the size of the spectrum buffer
+    for start in range(0, frames.shape[0], _FLATNESS_BLOCK_FRAMES):
+        block = frames[start : start + _FLATNESS_BLOCK_FRAMES] * window
+        power = np.abs(fft.rfft(block, axis=1, workers=-1)) ** 2
+        np.maximum(power, 1e-10, out=power)
+
+        # Ratio of geometric to arithmetic mean of the power spectrum
+        gmean = np.exp(np.mean(np.log(power), axis=1))
+        amean = np.mean(power, axis=1)
+        flatness_sum += float(np.sum(gmean / amean))
 
     # Average across all frames
-    return float(np.mean(flatness))
+    return flatness_sum / frames.shape[0]
+
+
+@lru_cache(maxsize=4)
+def _hann_window(n_fft: int) -> np.ndarray:
+    """Return a periodic Hann window of the given size."""
+    window = signal.get_window("hann", n_fft, fftbins=True)
+    window.setflags(write=False)
+    return window
 
 
 def calculate_dynamic_range(samples: np.ndarray) -> float:
@@ -132,11 +195,8 @@ def calculate_dynamic_range(samples: np.ndarray) -> float:
     if rms < 1e-10 or peak < 1e-10:
         return 0.0
 
-    # Dynamic range = peak level - RMS level (in dB)
-    peak_db = 20 * np.log10(peak)
-    rms_db = 20 * np.log10(rms)
-
-    return float(peak_db - rms_db)
+    # Dynamic range = peak level - RMS level (in dB), i.e. one log of the ratio
+    return 20 * math.log10(peak / rms)
 
 
 def calculate_clipping_ratio(samples: np.ndarray, threshold: float = 0.99) -> float:
@@ -152,7 +212,11 @@ def calculate_clipping_ratio(samples: np.ndarray, threshold: float = 0.99) -> fl
     if len(samples) == 0:
         return 0.0
 
-    clipped_count = np.sum(np.abs(samples) >= threshold)
+    # Compare each sign directly instead of materializing np.abs(samples)
+    clipped_count = (
+        np.count_nonzero(samples >= threshold)
+        + np.count_nonzero(samples <= -threshold)
+    )
     return float(clipped_count / len(samples))
 
 
@@ -172,10 +236,68 @@ def calculate_silence_ratio(samples: np.ndarray, threshold_db: float = -60) -> f
     # Convert threshold to linear
     threshold_linear = 10 ** (threshold_db / 20)
 
-    silent_count = np.sum(np.abs(samples) < threshold_linear)
+    silent_count = np.count_nonzero(
+        (samples < threshold_linear) & (samples > -threshold_linear)
+    )
     return float(silent_count / len(samples))
 
 
+def _level_metrics(samples: np.ndarray) -> tuple[float, float, float]:
+    """Compute dynamic range, clipping ratio and silence ratio in one pass.
+
+    Equivalent to calling calculate_dynamic_range, calculate_clipping_ratio
+    and calculate_silence_ratio with their default thresholds, but reads
+    the samples once instead of once per metric.
+
+    Args:
+        samples: Audio samples (mono).
+
+    Returns:
+        Tuple of (dynamic range in dB, clipping ratio, silence ratio).
+    """
+    n = samples.shape[0]
+    if n == 0:
+        return 0.0, 0.0, 1.0
+
+    peak, sum_sq, clipped, silent = _scan_levels(
+        np.ascontiguousarray(samples),
+        _CLIP_THRESHOLD,
+        10 ** (_SILENCE_THRESHOLD_DB / 20),
+    )
+
+    rms = math.sqrt(sum_sq / n)
+    if rms < 1e-10 or peak < 1e-10:
+        dynamic_range_db = 0.0
+    else:
+        dynamic_range_db = 20 * math.log10(peak / rms)
+
+    return dynamic_range_db, clipped / n, silent / n
+
+
+@njit(cache=True, parallel=True)
+def _scan_levels(
+    samples: np.ndarray,
+    clip_threshold: float,
+    silence_threshold: float,
+) -> tuple[float, float, int, int]:
+    """Return (peak, sum of squares, clipped count, silent count) (compiled)."""
+    peak = 0.0
+    sum_sq = 0.0
+    clipped = 0
+    silent = 0
+
+    for i in prange(samples.shape[0]):
+        value = abs(float(samples[i]))
+        peak = max(peak, value)
+        sum_sq += value * value
+        if value >= clip_threshold:
+            clipped += 1
+        if value < silence_threshold:
+            silent += 1
+
+    return peak, sum_sq, clipped, silent
+
+
 def _calculate_quality_score(
     snr_db: float,
     spectral_flatness: float,
@@ -196,11 +318,11 @@ def _calculate_quality_score(
         Quality score from 0.0 (poor) to 1.0 (excellent).
     """
     # SNR score: 0 dB -> 0, 40+ dB -> 1
-    snr_score = np.clip(snr_db / 40, 0, 1)
+    snr_score = _clip01(snr_db / 40)
 
     # Spectral flatness penalty: higher flatness (more noise) is worse
     # Typical music has flatness around 0.1-0.3
-    flatness_score = 1 - np.clip(spectral_flatness / 0.5, 0, 1)
+    flatness_score = 1 - _clip01(spectral_flatness / 0.5)
 
     # Dynamic range score: 6-20 dB is typical for mastered music
     # Too little (<6) or too much (>30) can indicate problems
@@ -212,26 +334,27 @@ def _calculate_quality_score(
         dr_score = max(0, 1 - (dynamic_range_db - 20) / 20)
 
     # Clipping penalty: any clipping reduces quality
-    clipping_score = 1 - np.clip(clipping_ratio * 100, 0, 1)  # 1% clipping -> 0 score
+    clipping_score = 1 - _clip01(clipping_ratio * 100)  # 1% clipping -> 0 score
 
     # Silence is okay, but too much silence (>90%) is suspicious
     silence_score = 1 if silence_ratio < 0.9 else 0.5
 
     # Weighted combination
-    weights = {
-        "snr": 0.35,
-        "flatness": 0.20,
-        "dynamic_range": 0.20,
-        "clipping": 0.20,
-        "silence": 0.05,
-    }
-
     score = (
-        weights["snr"] * snr_score
-        + weights["flatness"] * flatness_score
-        + weights["dynamic_range"] * dr_score
-        + weights["clipping"] * clipping_score
-        + weights["silence"] * silence_score
+        _SNR_WEIGHT * snr_score
+        + _FLATNESS_WEIGHT * flatness_score
+        + _DYNAMIC_RANGE_WEIGHT * dr_score
+        + _CLIPPING_WEIGHT * clipping_score
+        + _SILENCE_WEIGHT * silence_score
     )
 
-    return float(np.clip(score, 0, 1))
+    return float(_clip01(score))
+
+
+def _clip01(value: float) -> float:
+    """Clamp a scalar to [0, 1] without the np.clip array round trip."""
+    if value < 0.0:
+        return 0.0
+    if value > 1.0:
+        return 1.0
+    return value
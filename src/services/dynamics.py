@@ -1,9 +1,18 @@
 """Dynamic range processing service."""
 
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
 import numpy as np
+from numba import njit
 
 from src.models import EnhancementConfig
 
+# 10 ** (db / 20) == exp2(db * _DB_TO_LOG2); 20 * log10(x) == log2(x) * _LOG2_TO_DB
+_DB_TO_LOG2 = math.log2(10.0) / 20.0
+_LOG2_TO_DB = 20.0 / math.log2(10.0)
+
 
 def compress_dynamics(
     samples: np.ndarray,
@@ -24,6 +33,10 @@ def compress_dynamics(
     if not config.dynamics_enabled:
         return samples
 
+    # float32 is ample for audio and halves the memory traffic per pass
+    if samples.dtype != np.float32:
+        samples = samples.astype(np.float32, copy=False)
+
     # Compression parameters based on config
     if config.preserve_dynamics:
         # Gentle compression for preserving dynamics
@@ -70,6 +83,10 @@ def normalize_loudness(
     Returns:
         Normalized audio samples.
     """
+    # float32 is ample for audio and halves the memory traffic per pass
+    if samples.dtype != np.float32:
+        samples = samples.astype(np.float32, copy=False)
+
     # Calculate current loudness (simplified RMS-based approach)
     current_lufs = _estimate_loudness_lufs(samples)
 
@@ -83,7 +100,7 @@ def normalize_loudness(
     gain_db = np.clip(gain_db, -20.0, 20.0)
 
     # Apply gain
-    gain_linear = 10 ** (gain_db / 20)
+    gain_linear = math.exp2(gain_db * _DB_TO_LOG2)
     normalized = samples * gain_linear
 
     # Apply soft limiter to prevent clipping
@@ -117,10 +134,10 @@ def _apply_compression(
     Returns:
         Compressed audio samples.
     """
-    # Convert parameters
-    threshold_linear = 10 ** (threshold_db / 20)
-    attack_samples = int(sr * attack_ms / 1000)
-    release_samples = int(sr * release_ms / 1000)
+    # Convert parameters (cached per compressor setting)
+    consts = _compressor_consts(
+        threshold_db, ratio, attack_ms, release_ms, knee_db, makeup_gain_db, sr
+    )
 
     # Work with absolute values for envelope
     if samples.ndim == 1:
@@ -130,12 +147,10 @@ def _apply_compression(
         envelope = np.max(np.abs(samples), axis=1)
 
     # Smooth envelope with attack/release
-    smoothed_env = _smooth_envelope(envelope, attack_samples, release_samples)
+    smoothed_env = _smooth_envelope(envelope, consts.attack_coef, consts.release_coef)
 
     # Calculate gain reduction
-    gain_reduction = _calculate_gain_reduction(
-        smoothed_env, threshold_linear, ratio, knee_db
-    )
+    gain_reduction = _calculate_gain_reduction(smoothed_env, consts)
 
     # Apply gain reduction
     if samples.ndim == 1:
@@ -144,91 +159,144 @@ def _apply_compression(
         compressed = samples * gain_reduction[:, np.newaxis]
 
     # Apply makeup gain
-    if makeup_gain_db != 0:
-        makeup_linear = 10 ** (makeup_gain_db / 20)
-        compressed *= makeup_linear
+    if consts.makeup_linear != 1.0:
+        compressed *= consts.makeup_linear
 
     return compressed
 
 
+class _CompressorConsts(NamedTuple):
+    """Per-setting compressor constants derived by _compressor_consts()."""
+
+    attack_coef: float
+    release_coef: float
+    threshold_db: float
+    knee_db: float
+    half_knee_db: float
+    slope: float
+    makeup_linear: float
+
+
+@lru_cache(maxsize=16)
+def _compressor_consts(
+    threshold_db: float,
+    ratio: float,
+    attack_ms: float,
+    release_ms: float,
+    knee_db: float,
+    makeup_gain_db: float,
+    sr: int,
+) -> _CompressorConsts:
+    """Derive the compressor constants for one parameter set.
+
+    Every file processed with the same config shares these, so they are
+    computed once and cached.
+    """
+    attack_samples = int(sr * attack_ms / 1000)
+    release_samples = int(sr * release_ms / 1000)
+    threshold_linear = math.exp2(threshold_db * _DB_TO_LOG2)
+
+    return _CompressorConsts(
+        attack_coef=math.exp(-1.0 / max(attack_samples, 1)),
+        release_coef=math.exp(-1.0 / max(release_samples, 1)),
+        threshold_db=math.log2(max(threshold_linear, 1e-10)) * _LOG2_TO_DB,
+        knee_db=knee_db,
+        half_knee_db=knee_db / 2,
+        slope=1 / ratio - 1,
+        makeup_linear=math.exp2(makeup_gain_db * _DB_TO_LOG2),
+    )
+
+
 def _smooth_envelope(
     envelope: np.ndarray,
-    attack_samples: int,
-    release_samples: int,
+    attack_coef: float,
+    release_coef: float,
 ) -> np.ndarray:
     """Smooth an envelope with attack and release times.
 
     Args:
         envelope: Input envelope.
-        attack_samples: Attack time in samples.
-        release_samples: Release time in samples.
+        attack_coef: One-pole coefficient used while the envelope rises.
+        release_coef: One-pole coefficient used while the envelope falls.
 
     Returns:
         Smoothed envelope.
     """
-    smoothed = np.zeros_like(envelope)
-    smoothed[0] = envelope[0]
+    envelope = np.ascontiguousarray(envelope)
+    smoothed = np.empty_like(envelope)
+    if envelope.shape[0] == 0:
+        return smoothed
 
-    attack_coef = np.exp(-1.0 / max(attack_samples, 1))
-    release_coef = np.exp(-1.0 / max(release_samples, 1))
+    _smooth_envelope_kernel(envelope, smoothed, attack_coef, release_coef)
+    return smoothed
 
-    for i in range(1, len(envelope)):
-        if envelope[i] > smoothed[i - 1]:
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _smooth_envelope_kernel(
+    envelope: np.ndarray,
+    smoothed: np.ndarray,
+    attack_coef: float,
+    release_coef: float,
+) -> None:
+    """Run the attack/release one-pole follower into ``smoothed`` (compiled)."""
+    # The coefficient switches on the follower's own previous output, so this
+    # is not an LTI filter; lfilter (or a max of two lfilter passes) would
+    # change the attack/release response, hence the compiled loop.
+    prev = envelope[0]
+    smoothed[0] = prev
+
+    for i in range(1, envelope.shape[0]):
+        value = envelope[i]
+        if value > prev:
             # Attack phase
             coef = attack_coef
         else:
             # Release phase
             coef = release_coef
 
-        smoothed[i] = coef * smoothed[i - 1] + (1 - coef) * envelope[i]
-
-    return smoothed
+        prev = coef * prev + (1.0 - coef) * value
+        smoothed[i] = prev
 
 
 def _calculate_gain_reduction(
     envelope: np.ndarray,
-    threshold: float,
-    ratio: float,
-    knee_db: float,
+    consts: _CompressorConsts,
 ) -> np.ndarray:
     """Calculate gain reduction based on envelope and compressor settings.
 
     Args:
         envelope: Smoothed envelope.
-        threshold: Threshold in linear scale.
-        ratio: Compression ratio.
-        knee_db: Soft knee width in dB.
+        consts: Compressor constants from _compressor_consts().
 
     Returns:
         Gain reduction array (multiply with signal).
     """
-    gain = np.ones_like(envelope)
-
     # Avoid log of zero
-    envelope_safe = np.maximum(envelope, 1e-10)
-    envelope_db = 20 * np.log10(envelope_safe)
-    threshold_db = 20 * np.log10(max(threshold, 1e-10))
-
-    # Calculate gain reduction for each sample
-    for i in range(len(envelope)):
-        level_db = envelope_db[i]
-
-        if level_db <= threshold_db - knee_db / 2:
-            # Below knee - no compression
-            output_db = level_db
-        elif level_db >= threshold_db + knee_db / 2:
-            # Above knee - full compression
-            output_db = threshold_db + (level_db - threshold_db) / ratio
-        else:
-            # In the knee - soft transition
-            knee_factor = (level_db - threshold_db + knee_db / 2) / knee_db
-            compression_amount = knee_factor * knee_factor * (1 / ratio - 1) / 2
-            output_db = level_db + compression_amount * (level_db - threshold_db + knee_db / 2)
+    envelope_db = np.maximum(envelope, 1e-10)
+    np.log2(envelope_db, out=envelope_db)
+    envelope_db *= _LOG2_TO_DB
+
+    # Level relative to the threshold; reuse the buffer in place
+    over_db = np.subtract(envelope_db, consts.threshold_db, out=envelope_db)
+    knee_db = consts.knee_db
+    half_knee = consts.half_knee_db
+    slope = consts.slope
 
-        gain_reduction_db = output_db - level_db
-        gain[i] = 10 ** (gain_reduction_db / 20)
+    # Below knee - no compression
+    gain_db = np.zeros_like(over_db)
 
-    return gain
+    # Above knee - full compression
+    above = over_db >= half_knee
+    gain_db[above] = over_db[above] * slope
+
+    # In the knee - soft transition
+    in_knee = (over_db > -half_knee) & ~above
+    knee_offset = over_db[in_knee] + half_knee
+    knee_factor = knee_offset / knee_db
+    gain_db[in_knee] = knee_factor * knee_factor * slope / 2 * knee_offset
+
+    gain_db *= _DB_TO_LOG2
+    return np.exp2(gain_db, out=gain_db)
 
 
 def _estimate_loudness_lufs(samples: np.ndarray) -> float | None:
@@ -256,7 +324,7 @@ def _estimate_loudness_lufs(samples: np.ndarray) -> float | None:
 
     # Simplified conversion from RMS to LUFS
     # This is an approximation; true LUFS requires K-weighting
-    lufs = 20 * np.log10(rms) - 0.691
+    lufs = math.log2(rms) * _LOG2_TO_DB - 0.691
 
     return float(lufs)
 
@@ -271,12 +339,15 @@ def _soft_clip(samples: np.ndarray, threshold: float = 0.95) -> np.ndarray:
     Returns:
         Soft-clipped samples.
     """
-    # Use tanh-based soft clipping
-    clipped = np.where(
-        np.abs(samples) <= threshold,
-        samples,
-        np.sign(samples) * (threshold + (1 - threshold) * np.tanh(
-            (np.abs(samples) - threshold) / (1 - threshold)
-        ))
+    abs_samples = np.abs(samples)
+    mask = abs_samples > threshold
+    if not mask.any():
+        return samples
+
+    # Use tanh-based soft clipping, evaluated only on samples over threshold
+    magnitude = (abs_samples[mask] - threshold) / (1 - threshold)
+    clipped = samples.copy()
+    clipped[mask] = np.copysign(
+        threshold + (1 - threshold) * np.tanh(magnitude), samples[mask]
     )
     return clipped
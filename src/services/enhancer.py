@@ -1,6 +1,11 @@
 """Main enhancement pipeline orchestrator."""
 
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import repeat
 from pathlib import Path
 
 import numpy as np
@@ -14,6 +19,7 @@ from src.models import (
     QualityLevel,
     QualityMetrics,
 )
+from src.services.ai_models import preload_deepfilternet
 from src.services.analyzer import analyze_quality
 from src.services.dynamics import compress_dynamics, normalize_loudness
 from src.services.exporter import generate_output_path, save_audio
@@ -25,6 +31,7 @@ def enhance_audio(
     audio_file: AudioFile,
     config: EnhancementConfig,
     output_path: Path | str | None = None,
+    validate_output: bool = False,
 ) -> ProcessingResult:
     """Enhance audio quality using the full processing pipeline.
 
@@ -34,13 +41,16 @@ def enhance_audio(
     3. Apply noise reduction
     4. Apply spectral enhancement (EQ)
     5. Apply dynamic range processing
-    6. Validate output quality
+    6. Validate output quality (only if ``validate_output``)
     7. Export enhanced audio
 
     Args:
         audio_file: Input AudioFile to process.
         config: Enhancement configuration.
         output_path: Optional output path. If None, generates automatically.
+        validate_output: Whether to re-analyze the enhanced audio. The
+            analysis costs about as much as the input analysis and only
+            feeds ``output_metrics``, which stays None when skipped.
 
     Returns:
         ProcessingResult with outcome details.
@@ -48,6 +58,10 @@ def enhance_audio(
     start_time = time.time()
     stages: list[ProcessingStage] = []
 
+    # Carry float32 through the pipeline (the loader already yields it)
+    if audio_file.samples.dtype != np.float32:
+        audio_file = replace(audio_file, samples=audio_file.samples.astype(np.float32))
+
     try:
         # Stage 1: Analyze input quality
         stage_start = time.time()
@@ -63,25 +77,15 @@ def enhance_audio(
         if config.quality_level == QualityLevel.AUTO:
             config = select_config(input_metrics, config)
 
-        # Start with original samples
-        samples = audio_file.samples.copy()
+        # Start with original samples. Every stage returns a new array, so
+        # the input buffer is never modified and needs no defensive copy.
+        samples = audio_file.samples
         sr = audio_file.sample_rate
 
-        # Stage 3: Noise reduction
+        # Stage 3: Noise reduction (runs first, directly on the input file)
         if config.noise_reduction_strength > 0:
             stage_start = time.time()
 
-            # Create temporary AudioFile with current samples
-            temp_audio = AudioFile(
-                path=audio_file.path,
-                format=audio_file.format,
-                sample_rate=sr,
-                bit_depth=audio_file.bit_depth,
-                channels=audio_file.channels,
-                duration=audio_file.duration,
-                samples=samples,
-            )
-
             # Use AI if enabled and quality warrants it
             use_ai = (
                 config.ai_enhancement_enabled
@@ -89,7 +93,7 @@ def enhance_audio(
             )
 
             samples, nr_method = reduce_noise_with_fallback(
-                temp_audio,
+                audio_file,
                 config.noise_reduction_strength,
                 use_ai=use_ai,
             )
@@ -98,10 +102,8 @@ def enhance_audio(
                 name="noise_reduction",
                 method=nr_method,
                 duration=time.time() - stage_start,
-                parameters={
-                    "strength": config.noise_reduction_strength,
-                    "ai_used": nr_method == "deepfilternet",
-                },
+                parameters={"strength": config.noise_reduction_strength},
+                ai_used=nr_method == "deepfilternet",
             ))
         else:
             stages.append(ProcessingStage.skipped("noise_reduction"))
@@ -122,18 +124,6 @@ def enhance_audio(
         # Stage 5: Dynamic range processing
         if config.dynamics_enabled:
             stage_start = time.time()
-
-            # Create temporary AudioFile for dynamics processing
-            temp_audio = AudioFile(
-                path=audio_file.path,
-                format=audio_file.format,
-                sample_rate=sr,
-                bit_depth=audio_file.bit_depth,
-                channels=audio_file.channels,
-                duration=len(samples) / sr,
-                samples=samples,
-            )
-
             samples = compress_dynamics(samples, config)
             samples = normalize_loudness(samples, config.target_loudness_lufs, sr)
             stages.append(ProcessingStage.completed(
@@ -148,47 +138,40 @@ def enhance_audio(
         else:
             stages.append(ProcessingStage.skipped("dynamics"))
 
+        # Resolve the output path up front so the output AudioFile is built once
+        if output_path is None:
+            output_path = generate_output_path(audio_file.path)
+        else:
+            output_path = Path(output_path)
+
         # Create output AudioFile
-        output_audio = AudioFile(
-            path=audio_file.path,  # Will be updated after save
+        output_audio = replace(
+            audio_file,
+            path=output_path,
             format="wav",
-            sample_rate=sr,
             bit_depth=max(audio_file.bit_depth, 24),  # Upgrade to 24-bit
-            channels=audio_file.channels,
             duration=len(samples) / sr,
             samples=samples,
         )
 
         # Stage 6: Analyze output quality
-        stage_start = time.time()
-        output_metrics = analyze_quality(output_audio)
-        stages.append(ProcessingStage.completed(
-            name="validation",
-            method="quality_check",
-            duration=time.time() - stage_start,
-            parameters={"quality_score": output_metrics.quality_score},
-        ))
+        if validate_output:
+            stage_start = time.time()
+            output_metrics = analyze_quality(output_audio)
+            stages.append(ProcessingStage.completed(
+                name="validation",
+                method="quality_check",
+                duration=time.time() - stage_start,
+                parameters={"quality_score": output_metrics.quality_score},
+            ))
+        else:
+            output_metrics = None
+            stages.append(ProcessingStage.skipped("validation"))
 
         # Stage 7: Export
         stage_start = time.time()
-        if output_path is None:
-            output_path = generate_output_path(audio_file.path)
-        else:
-            output_path = Path(output_path)
-
         save_audio(output_audio, output_path)
 
-        # Update output audio with final path
-        output_audio = AudioFile(
-            path=output_path,
-            format="wav",
-            sample_rate=sr,
-            bit_depth=output_audio.bit_depth,
-            channels=output_audio.channels,
-            duration=output_audio.duration,
-            samples=samples,
-        )
-
         stages.append(ProcessingStage.completed(
             name="export",
             method="soundfile",
@@ -220,6 +203,111 @@ def enhance_audio(
         )
 
 
+def enhance_audio_batch(
+    audio_files: list[AudioFile],
+    config: EnhancementConfig,
+    output_dir: Path | str | None = None,
+    max_workers: int | None = None,
+    validate_output: bool = False,
+) -> list[ProcessingResult]:
+    """Enhance several audio files in parallel worker processes.
+
+    Each file runs through enhance_audio() in its own process, so the
+    analysis of one file overlaps with the processing and export of
+    others. When AI enhancement is enabled, every worker loads
+    DeepFilterNet once at startup and reuses it for all of its files.
+
+    Workers are spawned rather than forked: a fork of a parent that has
+    already run a parallel Numba kernel can hang on exit. As with any
+    spawned pool, a calling script needs an ``if __name__ == "__main__"``
+    guard.
+
+    The enhanced samples are written to disk and not sent back, so the
+    returned ``output_file`` entries carry empty ``samples``; load the
+    output path to get the audio. ``input_file`` is the caller's object.
+
+    Args:
+        audio_files: Input AudioFiles to process.
+        config: Enhancement configuration shared by all files.
+        output_dir: Directory for the enhanced files. If None, each output
+            is written next to its input.
+        max_workers: Number of worker processes. Defaults to half the CPU
+            count, since noise reduction is itself multithreaded.
+        validate_output: Whether to re-analyze each enhanced file.
+
+    Returns:
+        ProcessingResults in the same order as ``audio_files``.
+
+    Raises:
+        ValueError: If two inputs would be written to the same output path.
+    """
+    if not audio_files:
+        return []
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    max_workers = min(max_workers, len(audio_files))
+
+    output_paths = [generate_output_path(audio_file.path) for audio_file in audio_files]
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_paths = [output_dir / path.name for path in output_paths]
+
+    # Inputs sharing a basename would overwrite each other's output
+    seen: dict[Path, Path] = {}
+    for audio_file, path in zip(audio_files, output_paths):
+        resolved = path.resolve()
+        if resolved in seen:
+            raise ValueError(
+                f"{seen[resolved]} and {audio_file.path} would both be written to {path}"
+            )
+        seen[resolved] = audio_file.path
+
+    initializer = preload_deepfilternet if config.ai_enhancement_enabled else None
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+    ) as executor:
+        results = executor.map(
+            _enhance_batch_item,
+            audio_files,
+            repeat(config),
+            output_paths,
+            repeat(validate_output),
+        )
+        return [
+            replace(result, input_file=audio_file)
+            for audio_file, result in zip(audio_files, results)
+        ]
+
+
+def _enhance_batch_item(
+    audio_file: AudioFile,
+    config: EnhancementConfig,
+    output_path: Path,
+    validate_output: bool,
+) -> ProcessingResult:
+    """Run enhance_audio() in a worker, dropping sample data from the result.
+
+    The parent already holds the input and the output is on disk, so
+    neither array is pickled back.
+    """
+    result = enhance_audio(audio_file, config, output_path, validate_output)
+
+    no_samples = np.empty((0,) + audio_file.samples.shape[1:], dtype=np.float32)
+    return replace(
+        result,
+        input_file=replace(result.input_file, samples=no_samples),
+        output_file=(
+            replace(result.output_file, samples=no_samples)
+            if result.output_file is not None
+            else None
+        ),
+    )
+
+
 def select_config(
     metrics: QualityMetrics,
     user_config: EnhancementConfig,
@@ -249,15 +337,17 @@ def select_config(
         # Medium quality - use standard processing
         config = EnhancementConfig.standard()
 
+    overrides = {}
+
     # Preserve user overrides
     if user_config.target_loudness_lufs != -14.0:
-        config.target_loudness_lufs = user_config.target_loudness_lufs
+        overrides["target_loudness_lufs"] = user_config.target_loudness_lufs
 
     # Honor explicit disable flags from user
     if not user_config.ai_enhancement_enabled:
-        config.ai_enhancement_enabled = False
+        overrides["ai_enhancement_enabled"] = False
 
     if user_config.preserve_dynamics:
-        config.preserve_dynamics = True
+        overrides["preserve_dynamics"] = True
 
-    return config
+    return replace(config, **overrides) if overrides else config
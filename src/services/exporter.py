@@ -1,6 +1,6 @@
 """Audio file exporting service."""
 
-import os
+import shutil
 from pathlib import Path
 
 import numpy as np
@@ -8,6 +8,12 @@ import soundfile as sf
 
 from src.models import AudioFile, InsufficientSpaceError, OutputWriteError
 
+# Frames encoded per write when saving audio
+_WRITE_BLOCK_FRAMES = 1 << 18
+
+# Outputs smaller than this skip the free-space check
+_SPACE_CHECK_MIN_BYTES = 100 * 1024 * 1024
+
 
 def generate_output_path(input_path: str | Path, suffix: str = "_enhanced") -> Path:
     """Generate an output file path based on the input path.
@@ -69,19 +75,28 @@ def save_audio(
         raise InsufficientSpaceError(str(output_path))
 
     try:
-        # Ensure samples are in the right range for integer formats
         samples = audio_file.samples
-        if subtype.startswith("PCM_"):
-            # Clip to valid range for PCM formats
-            samples = np.clip(samples, -1.0, 1.0)
+        channels = 1 if samples.ndim == 1 else samples.shape[1]
+        is_pcm = subtype.startswith("PCM_")
 
-        sf.write(
+        # Encode in fixed-size blocks so no full-length temporary is needed
+        with sf.SoundFile(
             str(output_path),
-            samples,
-            audio_file.sample_rate,
+            "w",
+            samplerate=audio_file.sample_rate,
+            channels=channels,
             subtype=subtype,
             format="WAV",
-        )
+        ) as out:
+            for start in range(0, len(samples), _WRITE_BLOCK_FRAMES):
+                block = samples[start : start + _WRITE_BLOCK_FRAMES]
+                # Clip to valid range for PCM formats (the input is left as
+                # is); blocks already in range are written without a copy
+                if is_pcm and (
+                    block.max(initial=0.0) > 1.0 or block.min(initial=0.0) < -1.0
+                ):
+                    block = np.clip(block, -1.0, 1.0)
+                out.write(block)
         return True
 
     except sf.SoundFileError as e:
@@ -141,11 +156,14 @@ def _has_sufficient_space(directory: Path, required_bytes: int) -> bool:
     Returns:
         True if sufficient space is available.
     """
+    # Small outputs practically never fail for lack of space; skip the syscall
+    if required_bytes < _SPACE_CHECK_MIN_BYTES:
+        return True
+
     try:
-        stat = os.statvfs(str(directory))
-        available = stat.f_bavail * stat.f_frsize
+        available = shutil.disk_usage(str(directory)).free
         # Add 10% margin
         return available > required_bytes * 1.1
-    except (OSError, AttributeError):
+    except OSError:
         # If we can't check, assume there's space
         return True
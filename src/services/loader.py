@@ -13,12 +13,21 @@ from src.models import (
     UnsupportedChannelsError,
 )
 
+# Frames decoded per block when loading audio
+_READ_BLOCK_FRAMES = 1 << 20
 
-def validate_wav_format(path: str | Path) -> bool:
+
+def validate_wav_format(
+    path: str | Path,
+    *,
+    check_exists: bool = True,
+) -> bool:
     """Validate that a file is a valid WAV format.
 
     Args:
         path: Path to the audio file.
+        check_exists: Whether to check that the file exists. Callers that
+            have already checked can skip the extra stat.
 
     Returns:
         True if the file is a valid WAV file.
@@ -28,29 +37,26 @@ def validate_wav_format(path: str | Path) -> bool:
         InvalidFormatError: If the file is not a valid WAV file.
     """
     path = Path(path)
+    _check_wav_path(path, check_exists)
 
-    if not path.exists():
-        raise AudioFileNotFoundError(str(path))
-
-    # Check file extension
-    if path.suffix.lower() != ".wav":
-        raise InvalidFormatError(str(path), f"expected .wav extension, got {path.suffix}")
-
-    # Try to read file info to validate format
-    try:
-        info = sf.info(str(path))
-        if info.format != "WAV":
-            raise InvalidFormatError(str(path), f"file format is {info.format}, not WAV")
+    with _open_wav(path):
         return True
-    except sf.SoundFileError as e:
-        raise InvalidFormatError(str(path), str(e))
 
 
-def load_audio(path: str | Path) -> AudioFile:
+def load_audio(
+    path: str | Path,
+    *,
+    check_exists: bool = True,
+) -> AudioFile:
     """Load an audio file and return an AudioFile instance.
 
+    The file is opened once; the header parsed for validation also
+    supplies the metadata and the decoder for the samples.
+
     Args:
         path: Path to the audio file.
+        check_exists: Whether to check that the file exists. Callers that
+            have already checked can skip the extra stat.
 
     Returns:
         AudioFile instance with loaded audio data.
@@ -64,37 +70,94 @@ def load_audio(path: str | Path) -> AudioFile:
     path = Path(path)
 
     # Validate format first
-    validate_wav_format(path)
+    _check_wav_path(path, check_exists)
+
+    with _open_wav(path) as sound_file:
+        # Check channel count before decoding anything
+        if sound_file.channels > 2:
+            raise UnsupportedChannelsError(sound_file.channels)
+
+        try:
+            # Determine bit depth from subtype
+            bit_depth = _get_bit_depth(sound_file.subtype)
+
+            # Load audio data block by block into one preallocated buffer
+            samples = _read_samples(sound_file)
+
+            return AudioFile.from_file(
+                path=path,
+                samples=samples,
+                sample_rate=sound_file.samplerate,
+                bit_depth=bit_depth,
+            )
+
+        except sf.SoundFileError as e:
+            raise FileCorruptedError(str(path), str(e))
+        except MemoryError:
+            raise FileCorruptedError(str(path), "file too large to load into memory")
+
+
+def _check_wav_path(path: Path, check_exists: bool) -> None:
+    """Check that the path exists and has a .wav extension.
+
+    Raises:
+        AudioFileNotFoundError: If the file doesn't exist.
+        InvalidFormatError: If the extension is not .wav.
+    """
+    if check_exists and not path.exists():
+        raise AudioFileNotFoundError(str(path))
+
+    # Check file extension
+    if path.suffix.lower() != ".wav":
+        raise InvalidFormatError(str(path), f"expected .wav extension, got {path.suffix}")
 
-    try:
-        # Load audio data
-        samples, sample_rate = sf.read(str(path), dtype="float32")
-
-        # Get file info for bit depth
-        info = sf.info(str(path))
-
-        # Determine bit depth from subtype
-        bit_depth = _get_bit_depth(info.subtype)
-
-        # Check channel count
-        if samples.ndim == 1:
-            channels = 1
-        else:
-            channels = samples.shape[1]
-            if channels > 2:
-                raise UnsupportedChannelsError(channels)
-
-        return AudioFile.from_file(
-            path=path,
-            samples=samples,
-            sample_rate=sample_rate,
-            bit_depth=bit_depth,
-        )
 
+def _open_wav(path: Path) -> sf.SoundFile:
+    """Open a file for reading, checking that its header is WAV.
+
+    Returns:
+        The open SoundFile; the caller is responsible for closing it.
+
+    Raises:
+        InvalidFormatError: If the file cannot be parsed or is not WAV.
+    """
+    try:
+        sound_file = sf.SoundFile(str(path))
     except sf.SoundFileError as e:
-        raise FileCorruptedError(str(path), str(e))
-    except MemoryError:
-        raise FileCorruptedError(str(path), "file too large to load into memory")
+        raise InvalidFormatError(str(path), str(e))
+
+    if sound_file.format != "WAV":
+        file_format = sound_file.format
+        sound_file.close()
+        raise InvalidFormatError(str(path), f"file format is {file_format}, not WAV")
+
+    return sound_file
+
+
+def _read_samples(sound_file: sf.SoundFile) -> np.ndarray:
+    """Decode an open file as float32 into a single preallocated array.
+
+    Args:
+        sound_file: SoundFile positioned at the first frame.
+
+    Returns:
+        Samples of shape (frames,) for mono or (frames, channels) otherwise.
+    """
+    frames, channels = sound_file.frames, sound_file.channels
+    shape = (frames,) if channels == 1 else (frames, channels)
+    samples = np.empty(shape, dtype=np.float32)
+
+    pos = 0
+    for block in sound_file.blocks(
+        blocksize=_READ_BLOCK_FRAMES,
+        dtype="float32",
+        always_2d=channels > 1,
+    ):
+        samples[pos : pos + len(block)] = block
+        pos += len(block)
+
+    # Guard against a header that overstates the frame count
+    return samples[:pos] if pos < frames else samples
 
 
 def _get_bit_depth(subtype: str) -> int:
@@ -1,29 +1,43 @@
 """Noise reduction service using spectral gating and AI."""
 
+import math
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 import numpy as np
-import noisereduce as nr
+from scipy import fft, signal
 
 from src.models import AudioFile, ModelUnavailableError
-
-# AI imports - optional
-try:
-    from df.enhance import enhance as df_enhance
-    from src.services.ai_models import is_model_available, load_deepfilternet
-    AI_AVAILABLE = True
-except ImportError:
-    AI_AVAILABLE = False
+from src.services.ai_models import (
+    DEEPFILTERNET_AVAILABLE,
+    is_model_available,
+    load_deepfilternet,
+)
+
+# Spectral gating settings (noisereduce's defaults)
+_GATE_N_FFT = 1024
+_GATE_HOP_LENGTH = _GATE_N_FFT // 4
+_GATE_CHUNK_SIZE = 600000
+_GATE_PADDING = 30000
+_GATE_FREQ_SMOOTH_HZ = 500
+_GATE_TIME_SMOOTH_MS = 50
+_GATE_TIME_CONSTANT_S = 2.0
+_GATE_THRESH_N_MULT = 2
+_GATE_SIGMOID_SLOPE = 10
 
 
 def reduce_noise_spectral(
     audio_file: AudioFile,
     strength: float = 0.5,
     stationary: bool = False,
+    use_noisereduce: bool = False,
 ) -> np.ndarray:
     """Apply spectral gating noise reduction.
 
-    Uses the noisereduce library to perform spectral gating based
-    noise reduction. Works well for stationary noise like hum, hiss,
-    and constant background noise.
+    Runs noisereduce's spectral gating algorithm directly on SciPy's
+    STFT, processing all channels in one pass. Works well for stationary
+    noise like hum, hiss, and constant background noise.
 
     Args:
         audio_file: AudioFile instance to process.
@@ -32,6 +46,8 @@ def reduce_noise_spectral(
         stationary: If True, use stationary noise reduction (better for
                     constant noise). If False, use non-stationary
                     (better for varying noise).
+        use_noisereduce: If True, call the noisereduce library instead of
+                         the built-in implementation (for parity checks).
 
     Returns:
         Processed audio samples as numpy array.
@@ -47,28 +63,26 @@ def reduce_noise_spectral(
     # Lower = more aggressive, Higher = more conservative
     n_std_thresh = 2.0 - (strength * 1.0)  # Range: 1.0 to 2.0
 
-    if samples.ndim == 1:
-        # Mono audio
-        reduced = nr.reduce_noise(
-            y=samples,
-            sr=sr,
-            stationary=stationary,
-            prop_decrease=prop_decrease,
-            n_std_thresh_stationary=n_std_thresh,
-        )
-    else:
-        # Stereo audio - process each channel
-        reduced = np.zeros_like(samples)
-        for ch in range(samples.shape[1]):
-            reduced[:, ch] = nr.reduce_noise(
-                y=samples[:, ch],
-                sr=sr,
-                stationary=stationary,
-                prop_decrease=prop_decrease,
-                n_std_thresh_stationary=n_std_thresh,
-            )
+    if not use_noisereduce:
+        # Let the STFTs spread their batched transforms over all cores
+        with fft.set_workers(-1):
+            return _spectral_gate(samples, sr, stationary, n_std_thresh, prop_decrease)
+
+    # Only the parity path needs the library (and its joblib/tqdm imports)
+    import noisereduce as nr
 
-    return reduced
+    reduce = partial(
+        nr.reduce_noise,
+        sr=sr,
+        stationary=stationary,
+        prop_decrease=prop_decrease,
+        n_std_thresh_stationary=n_std_thresh,
+    )
+
+    # Process the channels concurrently, mono being the one-channel case
+    channels, mono = _as_2d(samples)
+    denoised = _map_channels(reduce, channels)
+    return denoised[:, 0] if mono else denoised
 
 
 def reduce_noise_ai(audio_file: AudioFile) -> np.ndarray:
@@ -86,13 +100,15 @@ def reduce_noise_ai(audio_file: AudioFile) -> np.ndarray:
     Raises:
         ModelUnavailableError: If DeepFilterNet is not available.
     """
-    if not AI_AVAILABLE:
+    if not DEEPFILTERNET_AVAILABLE:
         raise ModelUnavailableError("DeepFilterNet")
 
     if not is_model_available():
         raise ModelUnavailableError("DeepFilterNet")
 
     try:
+        from df.enhance import enhance as df_enhance
+
         model, df_state, target_sr = load_deepfilternet()
 
         samples = audio_file.samples
@@ -101,19 +117,7 @@ def reduce_noise_ai(audio_file: AudioFile) -> np.ndarray:
         # DeepFilterNet expects specific sample rate (typically 48kHz)
         # Resample if necessary
         if sr != target_sr:
-            import librosa
-            if samples.ndim == 1:
-                samples_resampled = librosa.resample(samples, orig_sr=sr, target_sr=target_sr)
-            else:
-                # Resample each channel
-                samples_resampled = np.zeros(
-                    (int(len(samples) * target_sr / sr), samples.shape[1]),
-                    dtype=samples.dtype
-                )
-                for ch in range(samples.shape[1]):
-                    samples_resampled[:, ch] = librosa.resample(
-                        samples[:, ch], orig_sr=sr, target_sr=target_sr
-                    )
+            samples_resampled = _resample(samples, sr, target_sr)
         else:
             samples_resampled = samples
 
@@ -123,16 +127,7 @@ def reduce_noise_ai(audio_file: AudioFile) -> np.ndarray:
 
         # Resample back to original sample rate if needed
         if sr != target_sr:
-            import librosa
-            if enhanced.ndim == 1:
-                enhanced = librosa.resample(enhanced, orig_sr=target_sr, target_sr=sr)
-            else:
-                enhanced_original_sr = np.zeros_like(samples)
-                for ch in range(enhanced.shape[1]):
-                    enhanced_original_sr[:, ch] = librosa.resample(
-                        enhanced[:, ch], orig_sr=target_sr, target_sr=sr
-                    )
-                enhanced = enhanced_original_sr
+            enhanced = _resample(enhanced, target_sr, sr)
 
         return enhanced
 
@@ -140,6 +135,188 @@ def reduce_noise_ai(audio_file: AudioFile) -> np.ndarray:
         raise ModelUnavailableError(f"DeepFilterNet - {e}")
 
 
+def _spectral_gate(
+    samples: np.ndarray,
+    sr: int,
+    stationary: bool,
+    n_std_thresh: float,
+    prop_decrease: float,
+) -> np.ndarray:
+    """Spectral gating over all channels at once.
+
+    Mirrors noisereduce.reduce_noise with its default settings: the signal
+    is processed in zero-padded chunks, a mask is derived from the STFT
+    magnitude (a per-frequency noise threshold when stationary, a
+    time-smoothed sigmoid otherwise), smoothed, and applied before the
+    inverse STFT. Each channel keeps its own noise statistics, but the
+    STFTs for all channels run in a single call.
+
+    Args:
+        samples: Audio samples (mono or stereo).
+        sr: Sample rate.
+        stationary: Whether to use stationary gating.
+        n_std_thresh: Noise threshold in standard deviations (stationary).
+        prop_decrease: Proportion by which to reduce the noise.
+
+    Returns:
+        Denoised samples with the input's shape and dtype.
+    """
+    # (n_channels, n_frames), as the STFT runs along the last axis
+    channels, mono = _as_2d(samples)
+    channels = channels.T
+    n_frames = channels.shape[1]
+    stft_args = {
+        "nfft": _GATE_N_FFT,
+        "nperseg": _GATE_N_FFT,
+        "noverlap": _GATE_N_FFT - _GATE_HOP_LENGTH,
+    }
+
+    if stationary:
+        # Per-frequency threshold from the start of each channel
+        _, _, noise_stft = signal.stft(
+            channels[:, :_GATE_CHUNK_SIZE], padded=False, **stft_args
+        )
+        noise_db = _amp_to_db(noise_stft)
+        noise_thresh = (
+            np.mean(noise_db, axis=-1) + np.std(noise_db, axis=-1) * n_std_thresh
+        )[:, :, np.newaxis]
+    else:
+        # One-pole low-pass used to track the magnitude over time
+        b = _gate_smoothing_coef(sr)
+        smooth_b, smooth_a = [b], [1, b - 1]
+
+    smoothing_filter = _gate_smoothing_filter(sr)
+    denoised = np.empty(channels.shape, dtype=samples.dtype)
+
+    # A signal that fits in one chunk is padded to its own length only
+    chunk_size = _GATE_CHUNK_SIZE if n_frames > _GATE_CHUNK_SIZE else n_frames
+
+    for start in range(0, n_frames, chunk_size):
+        end = start + chunk_size
+
+        # Zero-padded chunk so STFT edge effects fall outside the kept span
+        lo, hi = start - _GATE_PADDING, end + _GATE_PADDING
+        chunk = np.zeros((channels.shape[0], hi - lo))
+        chunk[:, max(lo, 0) - lo : min(hi, n_frames) - lo] = (
+            channels[:, max(lo, 0) : min(hi, n_frames)]
+        )
+
+        _, _, spec = signal.stft(chunk, padded=False, **stft_args)
+
+        if stationary:
+            mask = (_amp_to_db(spec) > noise_thresh).astype(np.float64)
+            mask = mask * prop_decrease + (1.0 - prop_decrease)
+            if smoothing_filter is not None:
+                mask = signal.fftconvolve(mask, smoothing_filter, mode="same", axes=(1, 2))
+        else:
+            magnitude = np.abs(spec)
+            smoothed = signal.filtfilt(smooth_b, smooth_a, magnitude, axis=-1, padtype=None)
+
+            # Sigmoid of how far each bin rises above its smoothed level
+            above = (magnitude - smoothed) / smoothed
+            mask = 1 / (1 + np.exp(-(above - _GATE_THRESH_N_MULT) * _GATE_SIGMOID_SLOPE))
+            if smoothing_filter is not None:
+                mask = signal.fftconvolve(mask, smoothing_filter, mode="same", axes=(1, 2))
+            mask = mask * prop_decrease + (1.0 - prop_decrease)
+
+        _, chunk_denoised = signal.istft(spec * mask, **stft_args)
+
+        keep = min(end, n_frames) - start
+        denoised[:, start : start + keep] = chunk_denoised[:, _GATE_PADDING : _GATE_PADDING + keep]
+
+    return denoised[0] if mono else denoised.T
+
+
+def _amp_to_db(spec: np.ndarray, top_db: float = 80.0) -> np.ndarray:
+    """Convert STFT magnitudes to dB, floored top_db below each bin's peak."""
+    spec_db = 20 * np.log10(np.abs(spec) + np.finfo(np.float64).eps)
+    return np.maximum(spec_db, np.max(spec_db, axis=-1, keepdims=True) - top_db)
+
+
+@lru_cache(maxsize=8)
+def _gate_smoothing_filter(sr: int) -> np.ndarray | None:
+    """Build the (1, freq, time) mask smoothing kernel for a sample rate."""
+    n_grad_freq = max(1, int(_GATE_FREQ_SMOOTH_HZ / (sr / (_GATE_N_FFT / 2))))
+    n_grad_time = max(1, int(_GATE_TIME_SMOOTH_MS / ((_GATE_HOP_LENGTH / sr) * 1000)))
+    if n_grad_freq == 1 and n_grad_time == 1:
+        return None
+
+    def ramp(n: int) -> np.ndarray:
+        return np.concatenate([
+            np.linspace(0, 1, n + 1, endpoint=False),
+            np.linspace(1, 0, n + 2),
+        ])[1:-1]
+
+    kernel = np.outer(ramp(n_grad_freq), ramp(n_grad_time))
+    kernel /= np.sum(kernel)
+    kernel.setflags(write=False)
+    return kernel[np.newaxis]
+
+
+@lru_cache(maxsize=8)
+def _gate_smoothing_coef(sr: int) -> float:
+    """One-pole coefficient for the non-stationary time smoothing."""
+    t_frames = _GATE_TIME_CONSTANT_S * sr / _GATE_HOP_LENGTH
+    return (math.sqrt(1 + 4 * t_frames**2) - 1) / (2 * t_frames**2)
+
+
+def _resample(samples: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Resample along the time axis with a polyphase filter.
+
+    Args:
+        samples: Audio samples (mono or stereo).
+        orig_sr: Current sample rate.
+        target_sr: Desired sample rate.
+
+    Returns:
+        Resampled audio samples; all channels are handled in one call.
+    """
+    g = math.gcd(orig_sr, target_sr)
+    return signal.resample_poly(samples, target_sr // g, orig_sr // g, axis=0)
+
+
+def _as_2d(samples: np.ndarray) -> tuple[np.ndarray, bool]:
+    """View samples as (n_samples, n_channels).
+
+    Args:
+        samples: Audio samples (mono or stereo).
+
+    Returns:
+        Tuple of the 2-D view and whether the input was mono, so the caller
+        can restore the original layout.
+    """
+    if samples.ndim == 1:
+        return samples[:, np.newaxis], True
+    return samples, False
+
+
+def _map_channels(
+    func: Callable[[np.ndarray], np.ndarray],
+    samples: np.ndarray,
+) -> np.ndarray:
+    """Apply a mono function to every channel concurrently.
+
+    The channels are independent and the heavy lifting (STFTs) happens in
+    NumPy/SciPy code that releases the GIL, so one thread per channel
+    overlaps well. Each thread also lets its FFTs use all cores.
+
+    Args:
+        func: Function taking and returning a 1-D channel.
+        samples: Multi-channel samples of shape (n_samples, n_channels).
+
+    Returns:
+        Processed channels stacked back into (n_samples, n_channels).
+    """
+    def run(channel: np.ndarray) -> np.ndarray:
+        # set_workers is thread-local, so it is entered in each worker
+        with fft.set_workers(-1):
+            return func(channel)
+
+    with ThreadPoolExecutor(max_workers=samples.shape[1]) as executor:
+        channels = list(executor.map(run, samples.T))
+    return np.column_stack(channels)
+
+
 def reduce_noise_with_fallback(
     audio_file: AudioFile,
     strength: float = 0.5,
@@ -158,7 +335,7 @@ def reduce_noise_with_fallback(
     Returns:
         Tuple of (processed samples, method used).
     """
-    if use_ai and AI_AVAILABLE:
+    if use_ai and DEEPFILTERNET_AVAILABLE:
         try:
             if is_model_available():
                 samples = reduce_noise_ai(audio_file)
@@ -7,6 +7,10 @@ from typing import Callable, Iterator, Optional
 from tqdm import tqdm
 
 
+def _noop_update(amount: int = 1) -> None:
+    """Progress update used when no stage bar is active."""
+
+
 class ProgressReporter:
     """Reports progress during audio enhancement.
 
@@ -36,6 +40,8 @@ class ProgressReporter:
         self.overall_start_time = time.time()
         self._pbar: Optional[tqdm] = None
         self._stage_pbar: Optional[tqdm] = None
+        # Bound once per stage so update() is a single call
+        self._update_fn: Callable[[int], object] = _noop_update
 
     def start_stage(self, name: str, total: int = 100) -> None:
         """Start a new processing stage.
@@ -66,6 +72,7 @@ class ProgressReporter:
             ncols=80,
             bar_format="{desc}: {bar} {percentage:3.0f}%",
         )
+        self._update_fn = self._stage_pbar.update
 
     def update(self, amount: int = 1) -> None:
         """Update progress within current stage.
@@ -73,10 +80,7 @@ class ProgressReporter:
         Args:
             amount: Amount of progress to add.
         """
-        if self.quiet or self._stage_pbar is None:
-            return
-
-        self._stage_pbar.update(amount)
+        self._update_fn(amount)
 
     def set_progress(self, percentage: float) -> None:
         """Set absolute progress percentage for current stage.
@@ -87,10 +91,9 @@ class ProgressReporter:
         if self.quiet or self._stage_pbar is None:
             return
 
-        current = self._stage_pbar.n
-        target = int(percentage)
-        if target > current:
-            self._stage_pbar.update(target - current)
+        delta = int(percentage) - self._stage_pbar.n
+        if delta > 0:
+            self._stage_pbar.update(delta)
 
     def complete_stage(self) -> None:
         """Mark current stage as complete."""
@@ -104,6 +107,7 @@ class ProgressReporter:
                 self._stage_pbar.update(remaining)
             self._stage_pbar.close()
             self._stage_pbar = None
+            self._update_fn = _noop_update
 
         if self.verbose:
             elapsed = time.time() - self.stage_start_time
@@ -160,6 +164,7 @@ class ProgressReporter:
         if self._stage_pbar is not None:
             self._stage_pbar.close()
             self._stage_pbar = None
+            self._update_fn = _noop_update
         if self._pbar is not None:
             self._pbar.close()
             self._pbar = None
@@ -188,7 +193,7 @@ def progress_stage(
                 update(10)
     """
     if reporter is None:
-        yield lambda x: None
+        yield _noop_update
         return
 
     reporter.start_stage(name, total)
@@ -7,6 +7,12 @@ from pathlib import Path
 import tempfile
 
 
+def _read_only(samples: np.ndarray) -> np.ndarray:
+    """Lock a session-scoped array so no test can modify it for the others."""
+    samples.setflags(write=False)
+    return samples
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -14,64 +20,68 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rate():
     """Standard sample rate for test audio."""
     return 44100
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mono_samples(sample_rate):
     """Generate mono test audio samples (3 seconds of sine wave with noise)."""
     duration = 3.0
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
+    t = np.arange(int(sample_rate * duration), dtype=np.float32) * np.float32(1.0 / sample_rate)
 
     # 440 Hz sine wave
     signal = 0.5 * np.sin(2 * np.pi * 440 * t)
 
     # Add some noise
-    noise = 0.05 * np.random.randn(len(t)).astype(np.float32)
+    noise = 0.05 * np.random.default_rng(0).standard_normal(len(t), dtype=np.float32)
 
-    return signal + noise
+    return _read_only(signal + noise)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def stereo_samples(mono_samples):
     """Generate stereo test audio samples."""
-    # Create stereo by duplicating mono with slight variation
-    left = mono_samples
-    right = mono_samples * 0.95 + 0.01 * np.random.randn(len(mono_samples)).astype(np.float32)
-    return np.column_stack([left, right])
+    # Create stereo by duplicating mono with slight variation, filling
+    # the channels of one preallocated buffer in place
+    stereo = np.empty((len(mono_samples), 2), dtype=np.float32)
+    stereo[:, 0] = mono_samples
+    np.multiply(mono_samples, np.float32(0.95), out=stereo[:, 1])
+    rng = np.random.default_rng(1)
+    stereo[:, 1] += np.float32(0.01) * rng.standard_normal(len(mono_samples), dtype=np.float32)
+    return _read_only(stereo)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def noisy_samples(sample_rate):
     """Generate noisy test audio samples (low SNR)."""
     duration = 3.0
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
+    t = np.arange(int(sample_rate * duration), dtype=np.float32) * np.float32(1.0 / sample_rate)
 
     # 440 Hz sine wave (weaker signal)
     signal = 0.3 * np.sin(2 * np.pi * 440 * t)
 
     # Add heavy noise
-    noise = 0.2 * np.random.randn(len(t)).astype(np.float32)
+    noise = 0.2 * np.random.default_rng(2).standard_normal(len(t), dtype=np.float32)
 
-    return signal + noise
+    return _read_only(signal + noise)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def clean_samples(sample_rate):
     """Generate clean test audio samples (high SNR)."""
     duration = 3.0
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
+    t = np.arange(int(sample_rate * duration), dtype=np.float32) * np.float32(1.0 / sample_rate)
 
     # 440 Hz sine wave (strong signal)
     signal = 0.7 * np.sin(2 * np.pi * 440 * t)
 
     # Very little noise
-    noise = 0.005 * np.random.randn(len(t)).astype(np.float32)
+    noise = 0.005 * np.random.default_rng(3).standard_normal(len(t), dtype=np.float32)
 
-    return signal + noise
+    return _read_only(signal + noise)
 
 
 @pytest.fixture
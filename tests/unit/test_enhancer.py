@@ -0,0 +1,72 @@
+"""Tests for the enhancement pipeline orchestrator."""
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from src.models import EnhancementConfig
+from src.services.enhancer import enhance_audio_batch
+from src.services.loader import load_audio
+
+
+@pytest.fixture
+def batch_config():
+    """Configuration that keeps the batch tests off the AI path."""
+    return EnhancementConfig(ai_enhancement_enabled=False)
+
+
+def _write_tone(path, frequency, sample_rate):
+    """Write a short sine tone and load it back as an AudioFile."""
+    t = np.arange(sample_rate // 2) / sample_rate
+    sf.write(str(path), 0.5 * np.sin(2 * np.pi * frequency * t), sample_rate)
+    return load_audio(path)
+
+
+class TestEnhanceAudioBatch:
+    """Tests for enhance_audio_batch."""
+
+    def test_results_follow_input_order(self, temp_dir, sample_rate, batch_config):
+        """Results line up with the inputs and every output is written."""
+        inputs = [
+            _write_tone(temp_dir / f"tone_{frequency}.wav", frequency, sample_rate)
+            for frequency in (220, 440, 880)
+        ]
+        output_dir = temp_dir / "out"
+        output_dir.mkdir()
+
+        results = enhance_audio_batch(inputs, batch_config, output_dir, max_workers=2)
+
+        assert len(results) == len(inputs)
+        for audio_file, result in zip(inputs, results):
+            assert result.success, result.error_message
+            assert result.input_file is audio_file
+            assert result.output_file.path == output_dir / f"{audio_file.path.stem}_enhanced.wav"
+            assert result.output_file.path.exists()
+
+    def test_results_do_not_carry_output_samples(self, temp_dir, sample_rate, batch_config):
+        """Enhanced samples stay on disk instead of being sent back."""
+        inputs = [_write_tone(temp_dir / "tone.wav", 440, sample_rate)]
+
+        result = enhance_audio_batch(inputs, batch_config)[0]
+
+        assert result.success, result.error_message
+        assert result.output_file.samples.size == 0
+        assert load_audio(result.output_file.path).num_samples == inputs[0].num_samples
+
+    def test_colliding_output_names_rejected(self, temp_dir, sample_rate, batch_config):
+        """Inputs sharing a basename cannot share one output directory."""
+        (temp_dir / "a").mkdir()
+        (temp_dir / "b").mkdir()
+        inputs = [
+            _write_tone(temp_dir / "a" / "song.wav", 440, sample_rate),
+            _write_tone(temp_dir / "b" / "song.wav", 880, sample_rate),
+        ]
+
+        with pytest.raises(ValueError, match="song_enhanced.wav"):
+            enhance_audio_batch(inputs, batch_config, temp_dir / "out")
+
+        assert not (temp_dir / "out" / "song_enhanced.wav").exists()
+
+    def test_empty_batch(self, batch_config):
+        """An empty batch returns no results without starting workers."""
+        assert enhance_audio_batch([], batch_config) == []
@@ -0,0 +1,67 @@
+"""Tests for the noise reduction service."""
+
+import numpy as np
+import pytest
+
+from src.models import AudioFile
+from src.services.noise_reduction import reduce_noise_spectral
+
+pytest.importorskip("noisereduce")
+
+
+def _audio_file(samples, sample_rate):
+    """Wrap samples in an in-memory AudioFile."""
+    return AudioFile.from_file(path="test.wav", samples=samples, sample_rate=sample_rate)
+
+
+class TestSpectralGateParity:
+    """The built-in spectral gate must match noisereduce exactly."""
+
+    @pytest.mark.parametrize("stationary", [False, True])
+    @pytest.mark.parametrize("strength", [0.2, 0.8])
+    def test_mono_matches_noisereduce(self, mono_samples, sample_rate, stationary, strength):
+        """Mono output is bit-identical to the library's."""
+        audio_file = _audio_file(mono_samples, sample_rate)
+
+        ours = reduce_noise_spectral(audio_file, strength, stationary)
+        reference = reduce_noise_spectral(audio_file, strength, stationary, use_noisereduce=True)
+
+        assert np.array_equal(ours, reference)
+
+    @pytest.mark.parametrize("stationary", [False, True])
+    def test_stereo_matches_noisereduce(self, stereo_samples, sample_rate, stationary):
+        """Each stereo channel is gated exactly as the library would."""
+        audio_file = _audio_file(stereo_samples, sample_rate)
+
+        ours = reduce_noise_spectral(audio_file, 0.5, stationary)
+        reference = reduce_noise_spectral(audio_file, 0.5, stationary, use_noisereduce=True)
+
+        assert np.array_equal(ours, reference)
+
+    @pytest.mark.parametrize("rate", [22050, 48000])
+    def test_other_sample_rates_match(self, mono_samples, rate):
+        """Sample-rate dependent smoothing matches at other rates too."""
+        audio_file = _audio_file(mono_samples, rate)
+
+        ours = reduce_noise_spectral(audio_file, 0.5)
+        reference = reduce_noise_spectral(audio_file, 0.5, use_noisereduce=True)
+
+        assert np.array_equal(ours, reference)
+
+    def test_multi_chunk_signal_matches(self, mono_samples, sample_rate):
+        """A signal spanning several processing chunks matches as well."""
+        audio_file = _audio_file(np.tile(mono_samples, 5), sample_rate)
+
+        ours = reduce_noise_spectral(audio_file, 0.5)
+        reference = reduce_noise_spectral(audio_file, 0.5, use_noisereduce=True)
+
+        assert np.array_equal(ours, reference)
+
+    def test_short_signal_matches(self, mono_samples, sample_rate):
+        """A signal shorter than one processing chunk matches as well."""
+        audio_file = _audio_file(mono_samples[:1000], sample_rate)
+
+        ours = reduce_noise_spectral(audio_file, 0.5)
+        reference = reduce_noise_spectral(audio_file, 0.5, use_noisereduce=True)
+
+        assert np.array_equal(ours, reference)
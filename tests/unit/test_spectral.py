@@ -0,0 +1,60 @@
+"""Tests for the spectral enhancement (EQ) service."""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from src.models import EnhancementConfig
+from src.services.spectral import (
+    _high_shelf_section,
+    _highpass_section,
+    _low_shelf_section,
+    _peak_section,
+    apply_eq,
+)
+
+
+def _eq_sections(sample_rate):
+    """The SOS rows apply_eq uses with the default configuration."""
+    rows = [
+        _highpass_section(sample_rate, cutoff=30),
+        _low_shelf_section(sample_rate, cutoff=100, gain_db=2.0),
+        _peak_section(sample_rate, center=3000, q=1.0, gain_db=2.0),
+        _high_shelf_section(sample_rate, cutoff=12000, gain_db=1.5),
+    ]
+    return np.array([row for row in rows if row is not None])
+
+
+class TestApplyEqShortInput:
+    """apply_eq must not fail on clips shorter than the cascade's padding."""
+
+    @pytest.mark.parametrize("length", [10, 20, 27])
+    def test_short_clip_filtered_band_by_band(self, mono_samples, sample_rate, length):
+        """Clips too short for the stacked cascade match per-band filtering."""
+        clip = mono_samples[:length]
+        expected = clip.astype(np.float64)
+        for section in _eq_sections(sample_rate):
+            expected = signal.sosfiltfilt(section[np.newaxis], expected)
+
+        filtered = apply_eq(clip, sample_rate, EnhancementConfig())
+
+        assert filtered.dtype == np.float32
+        np.testing.assert_allclose(filtered, expected, atol=1e-6)
+
+    def test_short_stereo_clip(self, stereo_samples, sample_rate):
+        """Short stereo clips keep their shape and dtype."""
+        clip = stereo_samples[:20]
+
+        filtered = apply_eq(clip, sample_rate, EnhancementConfig())
+
+        assert filtered.shape == clip.shape
+        assert filtered.dtype == np.float32
+
+    @pytest.mark.parametrize("length", [1, 5, 9])
+    def test_clip_shorter_than_one_section_unchanged(self, mono_samples, sample_rate, length):
+        """A clip too short for any section comes back unfiltered."""
+        clip = mono_samples[:length]
+
+        filtered = apply_eq(clip, sample_rate, EnhancementConfig())
+
+        np.testing.assert_array_equal(filtered, clip)